@@ -14,9 +14,10 @@ to avoid creating nonmanifold geometry, and keeps the rest of your pipeline:
 import os
 import sys
 import importlib
-import subprocess
+import itertools
 import re
 import shutil
+import pathlib
 
 import maya.cmds as cmds
 import maya.utils as utils
@@ -25,6 +26,7 @@ import maya.OpenMayaUI as omui
 
 from PySide2 import QtWidgets, QtCore, QtUiTools
 from PySide2.QtWidgets import QMainWindow, QMessageBox, QWidget
+from PySide2.QtGui import QDesktopServices
 from shiboken2 import wrapInstance
 
 from ..utils import camThumbnail
@@ -780,17 +782,26 @@ class PublishToolWindow(QMainWindow):
             if w:
                 w.setVisible(checked)
 
+    @staticmethod
+    def _set_value_silently(widget, value):
+        # Skip no-op updates and keep the paired widget from echoing back
+        if abs(widget.value() - value) < 1e-6:
+            return
+        widget.blockSignals(True)
+        widget.setValue(value)
+        widget.blockSignals(False)
+
     def update_proxy_spinbox(self, v):
-        self.ui.proxyReduceSpinBox.setValue(v / 10.0)
+        self._set_value_silently(self.ui.proxyReduceSpinBox, v / 10.0)
 
     def update_proxy_slider(self, v):
-        self.ui.proxyReduceSlider.setValue(int(v * 10))
+        self._set_value_silently(self.ui.proxyReduceSlider, int(v * 10))
 
     def update_lod_spinbox(self, v):
-        self.ui.lodReduceSpinBox.setValue(v / 10.0)
+        self._set_value_silently(self.ui.lodReduceSpinBox, v / 10.0)
 
     def update_lod_slider(self, v):
-        self.ui.lodReduceSlider.setValue(int(v * 10))
+        self._set_value_silently(self.ui.lodReduceSlider, int(v * 10))
 
     def open_project_folder(self):
         """
@@ -807,21 +818,15 @@ class PublishToolWindow(QMainWindow):
 
         # Create it if missing
         try:
-            if not os.path.exists(path):
-                os.makedirs(path, exist_ok=True)
+            os.makedirs(path, exist_ok=True)
         except Exception as e:
             QMessageBox.critical(self, "创建失败", f"无法创建路径：\n{path}\n\n错误：{e}")
             return
 
         # Open in system file browser
         try:
-            if sys.platform.startswith("win"):
-                # Use explorer with absolute, quoted path
-                subprocess.Popen(f'explorer "{path}"')
-            elif sys.platform == "darwin":
-                subprocess.Popen(["open", path])
-            else:
-                subprocess.Popen(["xdg-open", path])
+            if not QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path)):
+                raise RuntimeError("the desktop file browser did not accept the path")
         except Exception as e:
             QMessageBox.warning(self, "打开失败", f"无法打开文件夹：\n{path}\n\n错误：{e}")
 
@@ -830,33 +835,78 @@ class PublishToolWindow(QMainWindow):
         if not selected:
             cmds.warning("Please select a top-level group or any node in a shading network.")
             return
-        all_nodes_to_check = set()
+        # Node lists are collected first and hashed into one set at the end.
+        # Shading engines and non-DAG items are gathered so their history
+        # can be fetched with a single listHistory call.
+        node_lists = [selected]
+        history_roots = set()
         for item in selected:
-            all_nodes_to_check.add(item)
             if cmds.objectType(item, isType='transform'):
                 descendants = cmds.listRelatives(item, allDescendents=True, fullPath=True) or []
-                all_nodes_to_check.update(descendants)
+                node_lists.append(descendants)
                 shapes = cmds.listRelatives(item, allDescendents=True, type='shape', fullPath=True) or []
                 if shapes:
                     sgs = cmds.listConnections(shapes, type='shadingEngine')
                     if sgs:
-                        for sg in set(sgs):
-                            history = cmds.listHistory(sg) or []
-                            all_nodes_to_check.update(history)
+                        history_roots.update(sgs)
             else:
-                history = cmds.listHistory(item) or []
-                all_nodes_to_check.update(history)
+                history_roots.add(item)
+        if history_roots:
+            node_lists.append(cmds.listHistory(list(history_roots)) or [])
+        all_nodes_to_check = set(itertools.chain.from_iterable(node_lists))
         nodes_with_namespace = [node for node in all_nodes_to_check if ':' in node and cmds.objExists(node)]
         if not nodes_with_namespace:
             cmds.inViewMessage(msg="✅ 没有在所选物体或其关联网络中找到命名空间。", pos="topLeft", fade=True)
             return
+        # Group by the namespace of each node's own leaf name; nodes where only a
+        # parent in the path has a namespace are skipped. Long DAG paths / DG
+        # names are the form namespaceInfo(dagPath=True) returns.
+        nodes_by_namespace = {}
+        for node in cmds.ls(nodes_with_namespace, long=True) or []:
+            namespace = node.rpartition('|')[-1].rpartition(':')[0]
+            if namespace:
+                nodes_by_namespace.setdefault(namespace, []).append(node)
+        collected = set(itertools.chain.from_iterable(nodes_by_namespace.values()))
+        # Decided up front, while every stored path is still valid. Merging renames
+        # every node in a namespace, so a namespace is only merged when the
+        # selection owns all of its nodes and all of its child namespaces.
+        mergeable = set()
+        for namespace in sorted(nodes_by_namespace, key=lambda ns: ns.count(':'), reverse=True):
+            try:
+                ns_nodes = cmds.namespaceInfo(f":{namespace}", listOnlyDependencyNodes=True, dagPath=True) or []
+                ns_children = cmds.namespaceInfo(f":{namespace}", listOnlyNamespaces=True) or []
+            except Exception:
+                continue
+            if set(ns_nodes) <= collected and all(c.lstrip(':') in mergeable for c in ns_children):
+                mergeable.add(namespace)
         cleaned_count = 0
-        for node in sorted(nodes_with_namespace, key=len, reverse=True):
-            if ':' in node:
+        # Everything else is renamed in one pass, deepest DAG path first, so a
+        # rename never invalidates a path still to be renamed
+        to_rename = [node for ns, nodes in nodes_by_namespace.items() if ns not in mergeable for node in nodes]
+        for node in sorted(to_rename, key=len, reverse=True):
+            try:
+                if cmds.objExists(node) and not cmds.lockNode(node, q=True)[0]:
+                    clean_name = node.rpartition(':')[-1]
+                    cmds.rename(node, clean_name)
+                    cleaned_count += 1
+            except Exception as e:
+                print(f"Warning: Could not rename node {node}. Reason: {e}")
+        # Owned namespaces are merged into root with one Maya call each, nested
+        # ones first so their parents end up free of child namespaces
+        for namespace in sorted(mergeable, key=lambda ns: ns.count(':'), reverse=True):
+            try:
+                count = len(cmds.namespaceInfo(f":{namespace}", listOnlyDependencyNodes=True) or [])
+                cmds.namespace(removeNamespace=f":{namespace}", mergeNamespaceWithRoot=True)
+                cleaned_count += count
+                continue
+            except Exception as e:
+                print(f"Warning: Could not merge namespace {namespace}, renaming nodes instead. Reason: {e}")
+            # Not mergeable after all (e.g. referenced): rename its current nodes
+            current = cmds.namespaceInfo(f":{namespace}", listOnlyDependencyNodes=True, dagPath=True) or []
+            for node in sorted(current, key=len, reverse=True):
                 try:
                     if cmds.objExists(node) and not cmds.lockNode(node, q=True)[0]:
-                        clean_name = node.rpartition(':')[-1]
-                        cmds.rename(node, clean_name)
+                        cmds.rename(node, node.rpartition(':')[-1])
                         cleaned_count += 1
                 except Exception as e:
                     print(f"Warning: Could not rename node {node}. Reason: {e}")
@@ -936,7 +986,7 @@ class PublishToolWindow(QMainWindow):
         HAL_PROJECT_ABBR = os.environ.get("HAL_PROJECT_ABBR", "")
         HAL_USER_ABBR = os.environ.get("HAL_USER_ABBR", "")
 
-        path_segments = re.split(r"[\\/]", HAL_TASK_ROOT)
+        path_segments = pathlib.PureWindowsPath(HAL_TASK_ROOT).parts
         if "_library" in path_segments:
             file_name = f"{HAL_PROJECT_ABBR}_{HAL_ASSET}_{HAL_TASK}_{version}_{HAL_USER_ABBR}.ma"
         else:
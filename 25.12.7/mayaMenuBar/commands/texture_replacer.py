@@ -3,9 +3,22 @@ import os
 import re
 import glob
 
-def replace_textures(local_dir):
-    # Get all file texture nodes
-    file_nodes = cmds.ls(type='file')
+def get_file_nodes():
+    # Only walk the selection's shading history when something is selected,
+    # otherwise fall back to every file node in the scene
+    selection = cmds.ls(sl=True)
+    if selection:
+        history = cmds.listHistory(selection, future=False) or []
+        shapes = cmds.listRelatives(selection, allDescendents=True, type='shape', fullPath=True) or []
+        shading_groups = cmds.listConnections(selection + shapes, type='shadingEngine') or []
+        if shading_groups:
+            history += cmds.listHistory(list(set(shading_groups)), future=False) or []
+        return cmds.ls(history, type='file', long=False) or []
+    return cmds.ls(type='file', long=False) or []
+
+def replace_textures(local_dir, force_reload=False):
+    # Get file texture nodes (selection first, whole scene otherwise)
+    file_nodes = get_file_nodes()
     if not file_nodes:
         cmds.warning("No file texture nodes found in the scene.")
         return
@@ -61,8 +74,9 @@ def replace_textures(local_dir):
                 continue
         # Set new path
         cmds.setAttr(file_node + '.fileTextureName', new_path, type='string')
-        # Force reload by setting the attribute again to the same value
-        cmds.setAttr(file_node + '.fileTextureName', new_path, type='string')
+        # Only needed when the file on disk changed but the path string did not
+        if force_reload:
+            cmds.dgdirty(file_node + '.fileTextureName')
         updated_count += 1
     # Refresh the File Path Editor multiple times to ensure update
     cmds.filePathEditor(refresh=True)
@@ -73,8 +87,8 @@ def set_uv_tiling_mode(mode_field):
     selected_mode = cmds.optionMenu(mode_field, query=True, value=True)
     mode_map = {'Off': 0, '0-based (ZBrush)': 1, '1-based (Mudbox)': 2, 'UDIM (Mari)': 3, 'Explicit Tiles': 4}
     mode_value = mode_map.get(selected_mode, 0)
-    
-    file_nodes = cmds.ls(type='file')
+
+    file_nodes = get_file_nodes()
     if not file_nodes:
         cmds.warning("No file texture nodes found in the scene.")
         return
@@ -0,0 +1,2 @@
+"""Scratch scripts kept out of the menu; nothing here is imported by ui.py."""
+__all__ = []
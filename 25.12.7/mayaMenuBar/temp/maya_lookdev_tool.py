@@ -2,42 +2,54 @@ import maya.cmds as cmds
 import os
 import math
 
-def calculate_framing_distance(camera_shape_name, object_name):
+import numpy as np
+
+def calculate_framing_distances(camera_shape_name, object_names):
     """
-    根据一个指定的相机形状节点(camera shape)的FOV和物体的边界框，
-    计算能完整容纳该物体的最小相机距离。
+    calculate_framing_distance 的批量版本：一次性计算多个物体在同一相机下
+    能完整容纳的最小相机距离，返回与 object_names 顺序一致的 numpy 数组。
     """
-    # 这个辅助函数保持不变
-    print("\n--- Debug: Calculating Framing Distance ---")
+    print("\n--- Debug: Calculating Framing Distances ---")
     try:
         if not cmds.objExists(camera_shape_name) or cmds.nodeType(camera_shape_name) != 'camera':
             cmds.warning(f"Fatal Error: '{camera_shape_name}' is not a valid camera shape node.")
             return None
-        
-        fov_h_deg = cmds.camera(camera_shape_name, query=True, horizontalFieldOfView=True)
-        fov_v_deg = cmds.camera(camera_shape_name, query=True, verticalFieldOfView=True)
-        fov_h_rad = math.radians(fov_h_deg)
-        fov_v_rad = math.radians(fov_v_deg)
-        bbox = cmds.xform(object_name, query=True, boundingBox=True, worldSpace=True)
-        obj_width = bbox[3] - bbox[0]
-        obj_height = bbox[4] - bbox[1]
-
-        if obj_width == 0 and obj_height == 0: return 0.0
-        dist_for_width = (obj_width / 2.0) / math.tan(fov_h_rad / 2.0) if fov_h_rad > 0 else float('inf')
-        dist_for_height = (obj_height / 2.0) / math.tan(fov_v_rad / 2.0) if fov_v_rad > 0 else float('inf')
-        
-        fit_distance = max(dist_for_width, dist_for_height)
-        final_distance = fit_distance * 1.1
-        
-        print(f"  - Calculated distance to fit '{object_name}': {final_distance:.4f}")
+
+        fov_h_rad = math.radians(cmds.camera(camera_shape_name, query=True, horizontalFieldOfView=True))
+        fov_v_rad = math.radians(cmds.camera(camera_shape_name, query=True, verticalFieldOfView=True))
+        bboxes = np.array(
+            [cmds.xform(name, query=True, boundingBox=True, worldSpace=True) for name in object_names],
+            dtype=float
+        ).reshape(-1, 6)
+        widths = bboxes[:, 3] - bboxes[:, 0]
+        heights = bboxes[:, 4] - bboxes[:, 1]
+
+        dist_for_width = widths / (2.0 * math.tan(fov_h_rad / 2.0)) if fov_h_rad > 0 else np.full_like(widths, np.inf)
+        dist_for_height = heights / (2.0 * math.tan(fov_v_rad / 2.0)) if fov_v_rad > 0 else np.full_like(heights, np.inf)
+
+        final_distances = np.maximum(dist_for_width, dist_for_height) * 1.1
+        final_distances[(widths == 0) & (heights == 0)] = 0.0
+
+        for name, dist in zip(object_names, final_distances):
+            print(f"  - Calculated distance to fit '{name}': {dist:.4f}")
         print("--- End Debug ---")
-        return final_distance
-        
+        return final_distances
+
     except Exception as e:
         cmds.warning(f"An unexpected error occurred in calculation: {e}")
         print("--- End Debug ---")
         return None
 
+def calculate_framing_distance(camera_shape_name, object_name):
+    """
+    根据一个指定的相机形状节点(camera shape)的FOV和物体的边界框，
+    计算能完整容纳该物体的最小相机距离。
+    """
+    distances = calculate_framing_distances(camera_shape_name, [object_name])
+    if distances is None:
+        return None
+    return float(distances[0])
+
 def analyze_lookdev_setup():
     """
     主函数，执行完整的场景分析和设置流程，不包含对相机绑定的整体缩放。
@@ -125,4 +137,5 @@ def analyze_lookdev_setup():
 # --- 使用方法 ---
 # 1. 在Maya中，选择你想要进行lookdev的那个物体。
 # 2. 运行此脚本。
-analyze_lookdev_setup()
\ No newline at end of file
+if __name__ == "__main__":
+    analyze_lookdev_setup()
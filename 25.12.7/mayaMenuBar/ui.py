@@ -1,17 +1,15 @@
 """UI implementation for Maya Menu Bar."""
-import os
+import sys
 import importlib
 import maya.cmds as cmds
 import maya.utils as utils
 
-# Dynamically import all command modules from commands directory
-COMMANDS = {}
-commands_dir = os.path.join(os.path.dirname(__file__), 'commands')
-for filename in os.listdir(commands_dir):
-    if filename.endswith('.py') and not filename.startswith('_'):
-        module_name = filename[:-3]
-        module = importlib.import_module(f'mayaMenuBar.commands.{module_name}')
-        COMMANDS[module_name] = module.execute
+
+def _get_cmd(name):
+    """Import a command module on first click and return its execute function."""
+    module_name = f'mayaMenuBar.commands.{name}'
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return module.execute
 
 
 def create_menu():
@@ -38,7 +36,7 @@ def create_menu():
     )
     cmds.menuItem(
         label="Asset Publish",
-        command=lambda *args: utils.executeDeferred(COMMANDS['asset_publish']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('asset_publish')),
         parent=mdl_menu
     )
     cmds.setParent('..', menu=True)
@@ -52,7 +50,7 @@ def create_menu():
     )
     cmds.menuItem(
         label="Shader Publish",
-        command=lambda *args: utils.executeDeferred(COMMANDS['shader_publish']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('shader_publish')),
         parent=shader_menu
     )
     cmds.setParent('..', menu=True)
@@ -66,7 +64,7 @@ def create_menu():
     )
     cmds.menuItem(
         label="Rig Publish",
-        command=lambda *args: utils.executeDeferred(COMMANDS['rig_publish']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('rig_publish')),
         parent=rig_menu
     )
     cmds.setParent('..', menu=True)
@@ -80,17 +78,17 @@ def create_menu():
     )
     cmds.menuItem(
         label="Load MM Files",
-        command=lambda *args: utils.executeDeferred(COMMANDS['load_MM_files']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('load_MM_files')),
         parent=anim_menu
     )
     cmds.menuItem(
         label="Anim Playblast",
-        command=lambda *args: utils.executeDeferred(COMMANDS['anim_playblast']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('anim_playblast')),
         parent=anim_menu
     )
     cmds.menuItem(
         label="Anim Publish",
-        command=lambda *args: utils.executeDeferred(COMMANDS['anim_publish']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('anim_publish')),
         parent=anim_menu
     )
     cmds.setParent('..', menu=True)
@@ -104,17 +102,17 @@ def create_menu():
     )
     cmds.menuItem(
         label="Load MM Files",
-        command=lambda *args: utils.executeDeferred(COMMANDS['load_MM_files']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('load_MM_files')),
         parent=layout_menu
     )
     cmds.menuItem(
         label="Layout Playblast",
-        command=lambda *args: utils.executeDeferred(COMMANDS['layout_playblast']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('layout_playblast')),
         parent=layout_menu
     )
     cmds.menuItem(
         label="Layout Publish",
-        command=lambda *args: utils.executeDeferred(COMMANDS['layout_publish']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('layout_publish')),
         parent=layout_menu
     )
     cmds.setParent('..', menu=True)
@@ -128,12 +126,12 @@ def create_menu():
     )
     cmds.menuItem(
         label="MM Playblast",
-        command=lambda *args: utils.executeDeferred(COMMANDS['mm_playblast']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('mm_playblast')),
         parent=mm_menu
     )
     cmds.menuItem(
         label="MM Publish",
-        command=lambda *args: utils.executeDeferred(COMMANDS['mm_publish']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('mm_publish')),
         parent=mm_menu
     )
     cmds.setParent('..', menu=True)
@@ -157,43 +155,43 @@ def create_menu():
     )
     cmds.menuItem(
         label="Open",
-        command=lambda *args: utils.executeDeferred(COMMANDS['open_file']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('open_file')),
         parent=save_load_menu
     )
     cmds.menuItem(
         label="Save", 
-        command=lambda *args: utils.executeDeferred(COMMANDS['save_file']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('save_file')),
         parent=save_load_menu
     )
     # Get Start End Frame Submenu under UTILS
     cmds.menuItem(
         label="Get Start End Frame",
-        command=lambda *args: utils.executeDeferred(COMMANDS['get_start_end_frame']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('get_start_end_frame')),
         parent=utils_menu
     )
     # Shotgun Library Submenu under UTILS
     cmds.menuItem(
         label="Shotgun Library",
-        command=lambda *args: utils.executeDeferred(COMMANDS['shotgun_library']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('shotgun_library')),
         parent=utils_menu
     )
     # Rename Tool Submenu under UTILS
     cmds.menuItem(
         label="Rename Tool",
-        command=lambda *args: utils.executeDeferred(COMMANDS['rename_tool']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('rename_tool')),
         parent=utils_menu
     )
     # Texture Replacer Submenu under UTILS
     cmds.menuItem(
         label="Texture Replacer",
-        command=lambda *args: utils.executeDeferred(COMMANDS['texture_replacer']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('texture_replacer')),
         parent=utils_menu
     )
 
     # Save and Load Submenu under UTILS
     cmds.menuItem(
         label="Random Transforms",
-        command=lambda *args: utils.executeDeferred(COMMANDS['random_transforms']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('random_transforms')),
         parent=utils_menu
     )
 
@@ -206,33 +204,33 @@ def create_menu():
     )
     cmds.menuItem(
         label="Pause Update",
-        command=lambda *args: utils.executeDeferred(COMMANDS['pause_update']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('pause_update')),
         parent=pause_auto_menu
     )
     cmds.menuItem(
         label="Auto Update", 
-        command=lambda *args: utils.executeDeferred(COMMANDS['auto_update']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('auto_update')),
         parent=pause_auto_menu
     )
 
     # Remove Unknown Plugins Submenu under UTILS
     cmds.menuItem(
         label="Remove Unknown Plugins",
-        command=lambda *args: utils.executeDeferred(COMMANDS['remove_unknown_plugins']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('remove_unknown_plugins')),
         parent=utils_menu
     )
 
     # Deadline Submenu under UTILS
     cmds.menuItem(
         label="Submit Job To Deadline",
-        command=lambda *args: utils.executeDeferred(COMMANDS['submit_job_to_deadline']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('submit_job_to_deadline')),
         parent=utils_menu
     )
 
     # Maya Lookdev Tool Submenu under UTILS
     cmds.menuItem(
         label="Maya Lookdev Tool",
-        command=lambda *args: utils.executeDeferred(COMMANDS['maya_lookdev_tool']),
+        command=lambda *args: utils.executeDeferred(_get_cmd('maya_lookdev_tool')),
         parent=utils_menu
     )
 
@@ -1,4 +1,5 @@
 import os
+import re
 import subprocess
 import tempfile
 import logging
@@ -8,6 +9,23 @@ import sys
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Non-HAL variables that are forwarded to the farm (compared upper-cased)
+ALLOWED_MAYA_EXACT = frozenset({
+    "MAYA_PREFERRED_RENDERER",
+    "MAYA_ENABLE_LEGACY_RENDER_LAYERS",
+    "MAYA_VP2_DEVICE_OVERRIDE",
+    "ARNOLD_PLUGIN_PATH",
+    "MAYA_PLUG_IN_PATH",
+    "PATH",
+    "PYTHONPATH",
+})
+
+# One case-insensitive full match per key: any HAL* variable or an allowed exact name
+_ENV_FILTER_RE = re.compile(
+    r"HAL.*|" + "|".join(map(re.escape, sorted(ALLOWED_MAYA_EXACT))),
+    re.IGNORECASE,
+)
+
 class DeadlineSubmitter:
     def __init__(self, deadline_bin=None):
         """
@@ -36,6 +54,9 @@ class DeadlineSubmitter:
                 "Please ensure the Deadline 8 Client is installed."
             )
         
+        # mtoa scripts folder, prepended to the farm PYTHONPATH on every submit
+        self._arnold_script_path = os.path.join(os.environ.get("REZ_MAYA_MTOA_ROOT", ""), "scripts")
+
         logger.info(f"Initialized Deadline Submitter using: {self.deadline_bin}")
 
     def submit(self, job_info: dict, plugin_info: dict):
@@ -47,35 +68,31 @@ class DeadlineSubmitter:
         # --- ENVIRONMENT VARIABLE INJECTION ----------------------
         # ---------------------------------------------------------
         
-        env_index = 0
-        while f"EnvironmentKeyValue{env_index}" in job_info:
-            env_index += 1
+        # Continue numbering after any entries the caller already provided
+        env_prefix = "EnvironmentKeyValue"
+        existing = [
+            int(k[len(env_prefix):]) for k in job_info
+            if k.startswith(env_prefix) and k[len(env_prefix):].isdigit()
+        ]
+        env_index = max(existing, default=-1) + 1
 
         count_added = 0
 
-        REZ_MAYA_MTOA_ROOT = os.environ.get("REZ_MAYA_MTOA_ROOT")
-        arnoldScriptPath = f"{REZ_MAYA_MTOA_ROOT}\scripts"
-
-        ALLOWED_MAYA_EXACT = {
-            "MAYA_PREFERRED_RENDERER",  
-            "MAYA_ENABLE_LEGACY_RENDER_LAYERS",     
-            "MAYA_VP2_DEVICE_OVERRIDE",
-            "ARNOLD_PLUGIN_PATH",
-            "MAYA_PLUG_IN_PATH",
-            "PATH",
-            "PYTHONPATH",
-        }
-        for key, value in os.environ.items():
-
-            key_upper = key.upper()
-            if key_upper.startswith("HAL") or key_upper in ALLOWED_MAYA_EXACT:
-                ########Add arnold paths into PYTHONPATH###################
-                if key_upper == "PYTHONPATH":
-                    value = f"{arnoldScriptPath};{value}"
-
-                job_info[f"EnvironmentKeyValue{env_index}"] = f"{key}={value}"
-                env_index += 1
-                count_added += 1
+        arnold_pythonpath_prefix = f"{self._arnold_script_path};"
+
+        # Plain dict copy: os.environ re-encodes/decodes on every access
+        env_snapshot = dict(os.environ)
+        for key, value in env_snapshot.items():
+            if not _ENV_FILTER_RE.fullmatch(key):
+                continue
+
+            ########Add arnold paths into PYTHONPATH###################
+            if key.upper() == "PYTHONPATH":
+                value = arnold_pythonpath_prefix + value
+
+            job_info[f"EnvironmentKeyValue{env_index}"] = f"{key}={value}"
+            env_index += 1
+            count_added += 1
         
         # job_info[f"EnvironmentKeyValue{env_index}"] = f"PYTHONPATH={os.environ.get("ARNOLD_PLUGIN_PATH")}"
 
@@ -95,13 +112,23 @@ class DeadlineSubmitter:
         
         # Run the command
         try:
-            # creating CREATE_NO_WINDOW flag for Windows to avoid popping up cmd window
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-            result = subprocess.run(cmd, capture_output=True, text=True, startupinfo=startupinfo)
+            # CREATE_NO_WINDOW on Windows: no cmd window pops up and no console is
+            # allocated for deadlinecommand at all, which also makes it start faster
+            creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+            # Parse Job ID while streaming; output after it is drained but not kept
+            job_id = None
+            output = []
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, creationflags=creationflags) as proc:
+                for line in proc.stdout:
+                    if job_id is not None:
+                        continue
+                    if line.startswith("JobID="):
+                        job_id = line.split("=")[1].strip()
+                    else:
+                        output.append(line)
+                returncode = proc.wait()
         except Exception as e:
             self._cleanup(job_file, plugin_file)
             raise RuntimeError(f"Failed to execute deadlinecommand: {e}")
@@ -109,19 +136,12 @@ class DeadlineSubmitter:
         # Cleanup temp files
         self._cleanup(job_file, plugin_file)
 
-        if result.returncode != 0:
-            raise RuntimeError(f"Deadline submission failed:\n{result.stderr}\n{result.stdout}")
-
-        # Parse Job ID
-        job_id = None
-        for line in result.stdout.splitlines():
-            if line.startswith("JobID="):
-                job_id = line.split("=")[1].strip()
-                break
+        if returncode != 0:
+            raise RuntimeError(f"Deadline submission failed:\n{''.join(output)}")
         
         if not job_id:
             # Sometimes successful output doesn't start with JobID= immediately
-            logger.warning(f"Could not explicitly parse JobID from output. Output was:\n{result.stdout}")
+            logger.warning(f"Could not explicitly parse JobID from output. Output was:\n{''.join(output)}")
             return "Submission Successful (ID parsing failed)"
             
         return job_id
@@ -136,22 +156,18 @@ class DeadlineSubmitter:
     @staticmethod
     def _write_temp_file(info_dict, suffix):
         """Writes a dictionary to a temporary file in 'Key=Value' format."""
-        lines = []
-        for k, v in info_dict.items():
-            # Handle boolean values for Deadline (True -> True, False -> False/empty)
-            if isinstance(v, bool):
-                v = str(v)
-            # Filter out None values
-            if v is not None:
-                lines.append(f"{k}={v}")
-        
-        text = "\n".join(lines)
-        
-        # Create temp file, explicitly closing it so subprocess can read it
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, mode='w', encoding='utf-8')
-        tmp.write(text)
-        tmp.close()
-        return tmp.name
+        # Booleans are written as True/False; None values are skipped
+        payload = "\n".join(
+            f"{k}={v}" for k, v in info_dict.items() if v is not None
+        ).encode("utf-8")
+
+        # Write through the raw descriptor and close it so subprocess can read it
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        return path
 
 def deadline_submit(job_data, plugin_data):
     """
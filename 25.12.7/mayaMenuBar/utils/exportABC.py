@@ -53,7 +53,7 @@ def export_abc(path, start_frame, end_frame, include_curves=False, strip_namespa
 
     # --- MEL Command Construction ---
     path = path.replace('\\', '/')
-    roots_arg = " ".join([f"-root {node}" for node in selected_nodes])
+    roots_arg = " ".join(f"-root {node}" for node in selected_nodes)
     
     # Base arguments
     job_args = [
@@ -122,15 +122,13 @@ def execute_with_dialog():
 
 def get_command():
     """Returns the command implementation for standalone execution."""
-    def _command():
-        importlib.reload(sys.modules[__name__])
-        execute_with_dialog()
-    return _command
+    return execute_with_dialog
 
 def execute():
     """
     Main entry point for running this script standalone to export an animation.
+    Set MAYADY_DEV_RELOAD to re-read this module on every call while developing.
     """
-    importlib.reload(sys.modules[__name__])
-    cmd = get_command()
-    cmd()
\ No newline at end of file
+    if os.environ.get("MAYADY_DEV_RELOAD"):
+        importlib.reload(sys.modules[__name__])
+    execute_with_dialog()
\ No newline at end of file
@@ -8,6 +8,7 @@ Quick Shader Picker (mini)
 """
 
 import os, re, sys, traceback
+from functools import lru_cache
 import maya.cmds as cmds
 from PySide2 import QtWidgets, QtCore, QtGui
 from shiboken2 import wrapInstance
@@ -20,14 +21,22 @@ MAP_TO_SHD  = {"rig", "mdl", "cgfx-setup", "cgfx"}
 CATEGORY_ABBREVIATIONS = {'characters':'chr', 'environments':'env', 'props':'prp', 'vehicles':'veh', 'cgfx':'cgfx'}
 ABBR_TO_CATEGORY = {v:k for k,v in CATEGORY_ABBREVIATIONS.items()}
 USD_EXTS = (".usd", ".usdc", ".usda")
+MAX_VERSIONS = 200  # 单个资产最多拉取的 shd 版本数（新→旧）
+
+# ---------- precompiled patterns ----------
+_TOKENS_SORTED = sorted(set(ASSET_TYPES + SHOT_TYPES), key=len, reverse=True)
+_TOKEN_RE   = re.compile(r"_(%s)_" % "|".join(map(re.escape, _TOKENS_SORTED)))
+_V_SPLIT_RE = re.compile(r"_v\d+")
+# ASCII 小写 + 去掉 _/- 一次完成（ShotGrid 名称均为 ASCII）
+_CANON_TBL  = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz', '_-')
 
 def _maya_main_window():
     ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(ptr), QtWidgets.QWidget) if ptr else None
 
+@lru_cache(maxsize=4096)
 def _canon(s):
-    s = (s or "").strip().lower()
-    return re.sub(r'[_\-]', '', s)
+    return (s or "").strip().translate(_CANON_TBL)
 
 def _selected_namespace_token():
     sel = cmds.ls(sl=True, l=True) or []
@@ -38,10 +47,9 @@ def _selected_namespace_token():
     return parts[-1] if parts else ns
 
 def _extract_asset_and_task(last_token):
-    tokens = sorted(set(ASSET_TYPES + SHOT_TYPES), key=len, reverse=True)
-    m = re.search(r"_(%s)_" % "|".join(map(re.escape, tokens)), last_token)
+    m = _TOKEN_RE.search(last_token)
     if not m:
-        base = re.split(r"_v\d+", last_token)[0]
+        base = _V_SPLIT_RE.split(last_token)[0]
         task=""; asset_with_prefix=base
     else:
         task = m.group(1); asset_with_prefix = last_token[:m.start()]
@@ -52,6 +60,7 @@ def _extract_asset_and_task(last_token):
     asset_basename = asset_with_prefix[len(cat_abbr)+1:] if cat_abbr else asset_with_prefix
     return asset_with_prefix, task, cat_abbr, asset_basename
 
+@lru_cache(maxsize=4096)
 def _entity_matches_name(entity_name, cat_abbr, asset_basename):
     en = _canon(entity_name)
     no_prefix = _canon(asset_basename)
@@ -63,25 +72,47 @@ def _entity_matches_name(entity_name, cat_abbr, asset_basename):
 def _flatten_paths(x):
     if not x: return []
     if isinstance(x, str): return [x]
-    if isinstance(x, (list, tuple)):
-        out=[]; [out.extend(_flatten_paths(i)) for i in x]; return out
-    return []
+    out, stack = [], [x]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, str): out.append(cur)
+        elif isinstance(cur, (list, tuple)): stack.extend(reversed(cur))  # 保持原顺序
+    return out
 
 def _first_usd(paths):
-    for p in _flatten_paths(paths):
-        if isinstance(p, str) and p.lower().endswith(USD_EXTS):
-            return p.replace("\\","/")
+    # 边展开边匹配，命中第一个 USD 即返回
+    if not paths: return ""
+    stack = [paths]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, str):
+            if cur.lower().endswith(USD_EXTS):
+                return cur.replace("\\","/")
+        elif isinstance(cur, (list, tuple)): stack.extend(reversed(cur))
     return ""
 
+_SGDM_CACHE = {}  # "cls": 导入到的类（失败为 None），"inst": 复用的实例
+
 def _get_sgdm():
-    for modpath, attr in (("utils.SGlogin","ShotgunDataManager"),
-                          ("shotgun_data_manager","ShotgunDataManager")):
-        try:
-            m = __import__(modpath, fromlist=[attr])
-            return getattr(m, attr)()
-        except Exception:
-            pass
-    print("[QuickPicker] ShotgunDataManager 导入失败"); return None
+    inst = _SGDM_CACHE.get("inst")
+    if inst is not None: return inst
+    if "cls" not in _SGDM_CACHE:
+        _SGDM_CACHE["cls"] = None
+        for modpath, attr in (("utils.SGlogin","ShotgunDataManager"),
+                              ("shotgun_data_manager","ShotgunDataManager")):
+            try:
+                m = __import__(modpath, fromlist=[attr])
+                _SGDM_CACHE["cls"] = getattr(m, attr); break
+            except Exception:
+                pass
+    cls = _SGDM_CACHE["cls"]
+    if cls is None:
+        print("[QuickPicker] ShotgunDataManager 导入失败"); return None
+    try:
+        _SGDM_CACHE["inst"] = cls()
+    except Exception:
+        traceback.print_exc(); return None
+    return _SGDM_CACHE["inst"]
 
 def _find_entity_and_versions(dm):
     """解析选择 → 锁定 entity；并拿到它的 shd 版本（新→旧）"""
@@ -105,7 +136,7 @@ def _find_entity_and_versions(dm):
             ['code','contains', cat_abbr],
             ['code','contains', 'shd'],
         ]})
-    fields = ['id','code','sg_path_to_geometry','image','created_at','user','entity']
+    fields = ['id','code','sg_path_to_geometry','created_at','user','entity']
     try:
         vers = dm.sg.find('Version', filters, fields, order=[{'field_name':'created_at','direction':'desc'}]) or []
     except Exception as e:
@@ -122,6 +153,12 @@ def _find_entity_and_versions(dm):
     if not entity:
         return None, [], "未命中该资产（shd）"
 
+    # 第一次查询已覆盖该资产的 shd 版本时，直接本地按 entity 过滤，省一次往返
+    # （没有 geometry 的版本本来也会在 USD 筛选时被丢掉）
+    if not cat_abbr or cat_abbr.lower() in (entity.get('name') or '').lower():
+        own = [v for v in with_geo if (v.get('entity') or {}).get('id') == entity.get('id')]
+        return entity, own[:MAX_VERSIONS], ""
+
     # 真正拿该资产所有 shd 版本（新→旧）
     filters2 = [
         ['project','is', {'type':'Project','id': int(dm.HAL_PROJECT_SGID)}],
@@ -129,11 +166,45 @@ def _find_entity_and_versions(dm):
         ['code','contains','_shd_'],
     ]
     try:
-        all_shd = dm.sg.find('Version', filters2, fields, order=[{'field_name':'created_at','direction':'desc'}]) or []
+        all_shd = dm.sg.find('Version', filters2, fields, order=[{'field_name':'created_at','direction':'desc'}],
+                             limit=MAX_VERSIONS) or []
         return entity, all_shd, ""
     except Exception as e:
         return entity, [], f"取资产所有 shd 版本失败：{e}"
 
+class VersionsModel(QtCore.QAbstractTableModel):
+    """只保存 (code, created, user, usd) 元组，data() 仅对可见行调用"""
+    HEADERS = ["Version", "Created", "User", "USD Path"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def usd_at(self, row):
+        return self._rows[row][3] if 0 <= row < len(self._rows) else ""
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid(): return None
+        if role == QtCore.Qt.DisplayRole or (role == QtCore.Qt.ToolTipRole and index.column() in (0, 3)):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
 class QuickShaderPickerMini(QtWidgets.QDialog):
     pathSelected = QtCore.Signal(str)  # 发射 USD 路径
 
@@ -145,7 +216,7 @@ class QuickShaderPickerMini(QtWidgets.QDialog):
 
         self.dm = _get_sgdm()
         self.entity = None
-        self.versions = []   # 仅用于展示（新→旧）
+        self.versions = []   # 仅用于展示（新→旧）：(code, created, user, usd)
         self._build_ui()
         self._wire()
         self.refresh_from_selection()
@@ -155,8 +226,9 @@ class QuickShaderPickerMini(QtWidgets.QDialog):
         self.info = QtWidgets.QLabel("等待刷新…"); self.info.setStyleSheet("font-weight:600;")
         lay.addWidget(self.info)
 
-        self.table = QtWidgets.QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Version", "Created", "User", "USD Path"])
+        self.model = VersionsModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -191,9 +263,9 @@ class QuickShaderPickerMini(QtWidgets.QDialog):
         self.btn_open.clicked.connect(self.open_selected_folder)
         self.btn_ok.clicked.connect(self._use_selected)
         self.btn_cancel.clicked.connect(self.close)
-        self.table.itemSelectionChanged.connect(self._update_status)
+        self.table.selectionModel().selectionChanged.connect(self._update_status)
         # 双击直接确定
-        self.table.itemDoubleClicked.connect(lambda *_: self._use_selected())
+        self.table.doubleClicked.connect(lambda *_: self._use_selected())
 
     def refresh_from_selection(self):
         if not self.dm:
@@ -202,12 +274,16 @@ class QuickShaderPickerMini(QtWidgets.QDialog):
             ent, all_shd, tip = _find_entity_and_versions(self.dm)
             if tip: print(tip)
             self.entity = ent
-            # 只保留带 USD 路径的版本（取该版本中的首个 USD）
+            # 只保留带 USD 路径的版本（取该版本中的首个 USD），展示字段在此一次性算好
             rows=[]
             for v in all_shd:
                 usd = _first_usd(v.get('sg_path_to_geometry'))
                 if usd:
-                    rows.append((v, usd))
+                    created = v.get('created_at')
+                    rows.append((v.get('code','N/A'),
+                                 created.strftime("%Y-%m-%d %H:%M") if created else "N/A",
+                                 (v.get('user') or {}).get('name') or 'unknown',
+                                 usd))
             self.versions = rows
             asset_name = ent.get('name') if ent else "Unknown"
             self.info.setText(f"资产：{asset_name} | USD 版本：{len(rows)}（新→旧）")
@@ -218,19 +294,7 @@ class QuickShaderPickerMini(QtWidgets.QDialog):
             self.info.setText("刷新失败，请查看脚本编辑器输出。")
 
     def _rebuild_table(self):
-        self.table.setRowCount(0)
-        for v, usd in self.versions:
-            r = self.table.rowCount(); self.table.insertRow(r)
-            code = v.get('code','N/A')
-            created = v.get('created_at'); created_str = created.strftime("%Y-%m-%d %H:%M") if created else "N/A"
-            user = (v.get('user') or {}).get('name') or 'unknown'
-
-            it_code = QtWidgets.QTableWidgetItem(code); it_code.setToolTip(code)
-            it_time = QtWidgets.QTableWidgetItem(created_str)
-            it_user = QtWidgets.QTableWidgetItem(user)
-            it_path = QtWidgets.QTableWidgetItem(usd); it_path.setToolTip(usd)
-            self.table.setItem(r,0,it_code); self.table.setItem(r,1,it_time)
-            self.table.setItem(r,2,it_user); self.table.setItem(r,3,it_path)
+        self.model.set_rows(self.versions)
         if self.versions: self.table.selectRow(0)
         self._update_status()
 
@@ -241,8 +305,7 @@ class QuickShaderPickerMini(QtWidgets.QDialog):
     def _cur_usd(self):
         r = self._selected_row()
         if r<0: return ""
-        it = self.table.item(r, 3)
-        return (it.text() or "").strip() if it else ""
+        return (self.model.usd_at(r) or "").strip()
 
     def copy_selected(self):
         p = self._cur_usd()
@@ -356,9 +356,11 @@ class PlayblastDialog(QtWidgets.QDialog):
     # --- Placeholder methods for new buttons ---
     def on_get_sg_frames(self):
         try:
-            from mayaMenuBar.utils.SGlogin import ShotgunDataManager
-            sg_manager = ShotgunDataManager()
+            from mayaMenuBar.utils.SGlogin import get_manager
+            sg_manager = get_manager()
             SHOTID = sg_manager.SHOTID
+            # Shared manager: drop the cached Shot so cut edits made in ShotGrid this session are picked up
+            sg_manager.data_store.pop(f"Shot_{SHOTID}", None)
             shot_data = sg_manager.getSGData("Shot", SHOTID)[0]
             
             cut_in = shot_data.get('sg_cut_in')
@@ -139,10 +139,12 @@ class PublishToolWindow(QMainWindow):
         self.ui.startFrameEdit.setText(str(int(start_frame)))
 
     def set_sg_frame_range(self):
-        from mayaMenuBar.utils.SGlogin import ShotgunDataManager
-        sg_manager = ShotgunDataManager()
+        from mayaMenuBar.utils.SGlogin import get_manager
+        sg_manager = get_manager()
         # PROJECT_SGID = sg_manager.PROJECT_SGID
         SHOTID = sg_manager.SHOTID
+        # Shared manager: drop the cached Shot so cut edits made in ShotGrid this session are picked up
+        sg_manager.data_store.pop(f"Shot_{SHOTID}", None)
         cut_in = sg_manager.getSGData("Shot", SHOTID)[0].get('sg_cut_in', 'Not set')
         cut_out = sg_manager.getSGData("Shot", SHOTID)[0].get('sg_cut_out', 'Not set')
 
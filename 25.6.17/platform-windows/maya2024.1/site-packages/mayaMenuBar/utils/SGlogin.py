@@ -36,27 +36,11 @@ class ShotgunDataManager:
         return self.data_store[cache_key], self.PROJECT_SGID, self.SHOTID
 
 
-# Initialize manager (do this once)
-sg_manager = ShotgunDataManager()
-PROJECT_SGID = sg_manager.PROJECT_SGID
-SHOTID = sg_manager.SHOTID
-
-# # ===== USAGE EXAMPLES =====
-
-# # 1. Get ALL stored data for shot ID 8141
-# shot_data = sg_manager.getSGData("Shot", SHOTID)[0]
-# print("Full shot data:", shot_data)
-
-# # 2. Get SPECIFIC values (cut in/out)
-# cut_data = sg_manager.getSGData("Shot", SHOTID)[0]
-# print(f"Cut Range: {cut_data.get('sg_cut_in')}-{cut_data.get('sg_cut_out')}")
-
-# # 3. Get ONLY frame handles (efficient - fetches only needed fields)
-# handles = sg_manager.getSGData("Shot", SHOTID, fields=["sg_head_in", "sg_head_out"])[0]
-# print(f"Handles: {handles.get('sg_head_in')} - {handles.get('sg_head_out')}")
-
-# 4. Get value with fallback
-cut_in = sg_manager.getSGData("Shot", SHOTID)[0].get('sg_cut_in', 'Not set')
-cut_out = sg_manager.getSGData("Shot", SHOTID)[0].get('sg_cut_out', 'Not set')
-print(f"Cut In: {cut_in}")
-print(f"Cut Out: {cut_out}")
+# Created on first use so importing this module does not hit ShotGrid
+_m = None
+
+def get_manager():
+    """Return the shared ShotgunDataManager, creating it on first call"""
+    global _m
+    _m = _m or ShotgunDataManager()
+    return _m
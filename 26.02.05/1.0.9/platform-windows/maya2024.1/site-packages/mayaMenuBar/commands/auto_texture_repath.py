@@ -3,8 +3,52 @@ import maya.cmds as cmds
 import os
 import shutil
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import maya.utils
 from PySide2 import QtWidgets, QtCore, QtGui
 
+def norm_path(p):
+    """Forward slashes only; paths are built with '/' from here on."""
+    return p.replace('\\', '/')
+
+def fast_copy(src, dst, src_stat=None):
+    """Copy file contents only; returns False if dst already has the same size and mtime as src."""
+    src_stat = src_stat or os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        dst_stat = None
+    if dst_stat and dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+        return False
+    # copyfile uses the OS fast path (sendfile / fcopyfile / large buffers on Windows)
+    shutil.copyfile(src, dst)
+    # Carry the source mtime over so the next run can skip this file
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
+
+def iter_udim_matches(names, prefix, suffix):
+    """Yield names equal to prefix + 4 digits + suffix (prefix/suffix given lower-case)."""
+    tile_start = len(prefix)
+    tile_end = tile_start + 4
+    name_len = tile_end + len(suffix)
+    for name in names:
+        n = name.lower()
+        if len(n) == name_len and n.startswith(prefix) and n.endswith(suffix) and n[tile_start:tile_end].isdigit():
+            yield name
+
+def copy_one(src, dst, src_stat=None):
+    """Worker for the copy pool; returns (file name, 'copy' | 'skip' | 'error', error)."""
+    fname = os.path.basename(dst)
+    try:
+        return fname, ('copy' if fast_copy(src, dst, src_stat) else 'skip'), None
+    except Exception as e:
+        return fname, 'error', e
+
+class _CopySignals(QtCore.QObject):
+    """Emitted from the copy watcher thread; Qt queues it onto the GUI thread."""
+    advanced = QtCore.Signal(int)
+
 class PipelineTextureTool(QtWidgets.QDialog):
     def __init__(self, parent=None):
         super(PipelineTextureTool, self).__init__(parent)
@@ -50,7 +94,7 @@ class PipelineTextureTool(QtWidgets.QDialog):
             "此工具会将模型贴图（含 UDIM 序列）整理到项目标准目录。\n"
             "(Moves textures & UDIM sequences to project folder.)\n\n"
             "执行步骤 (Steps)：\n"
-            "1. 📦 **Deep Search**: Scans source folder using `os.listdir`.\n"
+            "1. 📦 **Deep Search**: Scans source folder using `os.scandir`.\n"
             "2. 🔍 **Regex Pattern**: Auto-detects 1001/1002 sequences.\n"
             "3. 📝 **Logging**: Detailed logs will appear in Script Editor.\n\n"
             "请选中模型，然后点击下方按钮。"
@@ -92,7 +136,7 @@ class PipelineTextureTool(QtWidgets.QDialog):
             QtWidgets.QMessageBox.critical(None, 'Pipeline Error', '错误：环境变量 HAL_ASSET_ROOT 缺失。')
             return
 
-        target_dir = os.path.join(asset_root, 'txt').replace('\\', '/')
+        target_dir = norm_path(asset_root).rstrip('/') + '/txt'
         print(f"Target Directory: {target_dir}")
 
         if not os.path.exists(target_dir):
@@ -115,15 +159,10 @@ class PipelineTextureTool(QtWidgets.QDialog):
         unique_files = set()
         
         # 1. Get Shapes from selection
-        shapes = cmds.listRelatives(selection, allDescendents=True, type='shape', fullPath=True) or []
-        for sel in selection:
-            # Handle if user selected the shape directly or a transform
-            if cmds.nodeType(sel) == 'mesh':
-                shapes.append(sel)
-            child_shapes = cmds.listRelatives(sel, shapes=True, fullPath=True) or []
-            shapes.extend(child_shapes)
-            
-        shapes = list(set(shapes))
+        # allDescendents already covers direct child shapes; add meshes selected directly
+        shapes = set(cmds.listRelatives(selection, allDescendents=True, type='shape', fullPath=True) or [])
+        shapes.update(cmds.ls(selection, type='mesh', long=True) or [])
+        shapes = list(shapes)
         
         if not shapes:
             print("!! No shapes found in selection.")
@@ -136,10 +175,9 @@ class PipelineTextureTool(QtWidgets.QDialog):
 
         # 3. Get Files from Shading Engines History
         if sgs:
-            history = cmds.listHistory(sgs)
-            files = cmds.ls(history, type=['file', 'aiImage'])
-            for f in files:
-                unique_files.add(f)
+            # pruneDagObjects keeps the walk to the shading network (skips meshes/deformers)
+            history = cmds.listHistory(sgs, pruneDagObjects=True) or []
+            unique_files.update(cmds.ls(history, type=['file', 'aiImage']) or [])
         
         if not unique_files:
             print("!! No file nodes found connected to materials.")
@@ -151,21 +189,29 @@ class PipelineTextureTool(QtWidgets.QDialog):
         # --- PROCESSING ---
         cmds.waitCursor(state=True)
         
-        processed_count = 0
         stats = {'copy': 0, 'error': 0, 'skip': 0, 'relink': 0}
+        dir_cache = {}  # source_dir -> {file name: stat}, shared by nodes in the same folder
+        copy_futures = {}  # dst -> future, deduplicated across nodes sharing a UDIM set
+        relinks = []     # (attr, new_path), applied on the main thread after copying
 
+        # Copies are I/O bound; they start as soon as each node's matches are known
+        pool = ThreadPoolExecutor(max_workers=16)
         try:
-            for node in unique_files:
+            # One ls call classifies every node (file vs aiImage), then read all paths up front
+            nodes = list(unique_files)
+            typed = cmds.ls(nodes, showType=True) or []
+            node_types = dict(zip(typed[::2], typed[1::2]))
+            attrs = {n: f"{n}.fileTextureName" if node_types.get(n) == 'file' else f"{n}.filename" for n in nodes}
+            raw_paths = {n: cmds.getAttr(attrs[n]) for n in nodes}
+
+            for node in nodes:
                 print(f"\n--- Inspecting Node: {node} ---")
                 
                 # 1. Get Path
-                node_type = cmds.nodeType(node)
-                attr_name = "fileTextureName" if node_type == 'file' else "filename"
-                full_attr = f"{node}.{attr_name}"
-                
-                raw_path = cmds.getAttr(full_attr)
+                full_attr = attrs[node]
+                raw_path = raw_paths[node]
                 # Expand env vars immediately
-                source_path = os.path.expandvars(raw_path).replace('\\', '/')
+                source_path = norm_path(os.path.expandvars(raw_path))
 
                 print(f"Raw Path: {raw_path}")
                 print(f"Resolved Path: {source_path}")
@@ -177,100 +223,162 @@ class PipelineTextureTool(QtWidgets.QDialog):
                 source_dir = os.path.dirname(source_path)
                 filename = os.path.basename(source_path)
 
-                # 2. Scan Source Directory
-                if not os.path.exists(source_dir):
-                    print(f"!! Source directory missing: {source_dir}")
-                    stats['error'] += 1
-                    continue
-
-                try:
-                    all_source_files = os.listdir(source_dir)
-                    print(f"[DEBUG] Scanning Source Dir. Found {len(all_source_files)} files.")
-                except Exception as e:
-                    print(f"!! Error listing source directory: {e}")
-                    stats['error'] += 1
-                    continue
-
-                # 3. Identify UDIM Sequence using Regex
+                # 2. Identify UDIM Sequence using Regex
                 # Pattern: Looks for .1001. or _1001_ or similar
                 match = re.search(r'[._](\d{4})[._]', filename)
-                files_to_copy = []
 
                 if match:
-                    udim_number = match.group(1) # e.g. "1001"
-                    escaped_name = re.escape(filename)
-                    # Replace 1001 with \d{4} to match siblings
-                    pattern_str = escaped_name.replace(udim_number, r'\d{4}')
-                    pattern = re.compile(pattern_str, re.IGNORECASE)
-                    
-                    print(f"[LOGIC] UDIM Detected. Pattern: {pattern_str}")
+                    # Siblings share everything around the 4 tile digits (case-insensitive)
+                    prefix = filename[:match.start() + 1].lower()
+                    suffix = filename[match.end() - 1:].lower()
                     
-                    for f in all_source_files:
-                        if pattern.search(f):
-                            files_to_copy.append(f)
+                    print(f"[LOGIC] UDIM Detected. Pattern: {prefix}####{suffix}")
                 else:
                     # No sequence, check for single file
                     print("[LOGIC] Single file (No UDIM pattern).")
-                    if filename in all_source_files:
-                        files_to_copy.append(filename)
-
-                if not files_to_copy:
-                    print("!! No matching files found in source folder.")
-                    stats['error'] += 1
-                    continue
 
-                print(f"[ACTION] Found {len(files_to_copy)} files to copy.")
+                # 3. Scan Source Directory (each folder is listed once per run)
+                all_source_files = dir_cache.get(source_dir)
+                if all_source_files is None:
+                    if not os.path.exists(source_dir):
+                        print(f"!! Source directory missing: {source_dir}")
+                        stats['error'] += 1
+                        continue
 
-                # 4. Copy Files
-                for fname in files_to_copy:
-                    src_full = os.path.join(source_dir, fname)
-                    dst_full = os.path.join(target_dir, fname)
-                    
-                    # Log the copy attempt
-                    print(f"   -> Copying: {fname}")
-                    
                     try:
-                        shutil.copy2(src_full, dst_full)
-                        stats['copy'] += 1
+                        # On Windows DirEntry.stat() comes with the listing, no extra syscall
+                        with os.scandir(source_dir) as it:
+                            all_source_files = {entry.name: entry.stat() for entry in it}
+                        dir_cache[source_dir] = all_source_files
+                        print(f"[DEBUG] Scanning Source Dir. Found {len(all_source_files)} files.")
                     except Exception as e:
-                        print(f"   !! FAILED: {e}")
+                        print(f"!! Error listing source directory: {e}")
                         stats['error'] += 1
+                        continue
+                else:
+                    print(f"[DEBUG] Reusing cached listing of {source_dir}.")
+
+                if match:
+                    matches = iter_udim_matches(all_source_files, prefix, suffix)
+                else:
+                    matches = (filename,) if filename in all_source_files else ()
+
+                # 4. Start Copies while matches stream in
+                found = 0
+                for fname in matches:
+                    found += 1
+                    dst_full = '/'.join((target_dir, fname))
+                    if dst_full not in copy_futures:
+                        copy_futures[dst_full] = pool.submit(
+                            copy_one, os.path.join(source_dir, fname), dst_full, all_source_files[fname])
+
+                if not found:
+                    print("!! No matching files found in source folder.")
+                    stats['error'] += 1
+                    continue
+
+                print(f"[ACTION] Found {found} files to copy.")
 
-                # 5. Relink Maya Node
+                # 5. Queue Relink
                 # We always point the Maya node to the file in the new directory.
                 # Usually we point it to the '1001' version or the original filename version.
-                new_path = os.path.join(target_dir, filename).replace('\\', '/')
+                new_path = '/'.join((target_dir, filename))
                 
                 if raw_path != new_path:
-                    try:
-                        cmds.setAttr(full_attr, new_path, type="string")
-                        stats['relink'] += 1
-                        print(f"   [RELINK] Updated node path to: {new_path}")
-                    except Exception as e:
-                        print(f"   !! Relink failed: {e}")
+                    relinks.append((full_attr, new_path))
 
         except Exception as final_e:
+            pool.shutdown(wait=False)
             cmds.waitCursor(state=False)
             print(f"CRITICAL ERROR: {final_e}")
             QtWidgets.QMessageBox.critical(None, 'Critical Error', str(final_e))
             return
-            
+
         cmds.waitCursor(state=False)
 
-        # Final Scan of Destination
-        print("\n" + "="*60)
-        print("FINAL VERIFICATION")
+        # --- BACKGROUND COPY ---
+        # Copies finish on worker threads so Maya stays responsive; a watcher thread
+        # reports progress and hands the relink back to the main thread.
+        self._progress = QtWidgets.QProgressDialog("正在复制贴图 (Copying textures)...", None, 0, len(copy_futures), get_maya_window())
+        self._progress.setWindowTitle("Auto Texture Repath")
+        self._progress.setMinimumDuration(0)
+        self._progress.setValue(0)
+        self._progress.show()
+        self._signals = _CopySignals()
+        self._signals.advanced.connect(self._progress.setValue)
+        threading.Thread(
+            target=self._wait_for_copies,
+            args=(pool, list(copy_futures.values()), relinks, stats, target_dir),
+            daemon=True
+        ).start()
+
+    def _wait_for_copies(self, pool, futures, relinks, stats, target_dir):
+        """Background thread: wait for every copy, then defer the Maya-side work."""
+        results = []
+        for i, future in enumerate(futures, 1):
+            results.append(future.result())
+            self._signals.advanced.emit(i)
+        pool.shutdown(wait=True)
+        maya.utils.executeDeferred(lambda: self._finish_pipeline(results, relinks, stats, target_dir))
+
+    def _finish_pipeline(self, results, relinks, stats, target_dir):
+        """Main thread: report copy results, relink nodes and show the summary."""
+        self._progress.close()
+
+        # 6. Collect Copy Results
+        if results:
+            print(f"\n[ACTION] Finished {len(results)} copies.")
+        for fname, status, err in results:
+            stats[status] += 1
+            if status == 'copy':
+                print(f"   -> Copied: {fname}")
+            elif status == 'skip':
+                print(f"   -- Skipped (unchanged in target): {fname}")
+            else:
+                print(f"   !! FAILED: {fname}: {err}")
+
+        # 7. Relink Maya Nodes (main thread only)
+        # Relinks are not recorded in the undo queue (which is flushed afterwards,
+        # as its older entries no longer match the scene), and cached playback
+        # is paused so each setAttr does not invalidate the cache
+        undo_state = cmds.undoInfo(query=True, state=True)
+        cmds.undoInfo(stateWithoutFlush=False)
         try:
-            dest_content = os.listdir(target_dir)
-            print(f"Destination now contains {len(dest_content)} files.")
-            # print(f"Files: {dest_content}") # Uncomment if you want a huge list
-        except:
-            pass
-        print("="*60 + "\n")
+            cache_enabled = cmds.evaluator(name='cache', query=True, enable=True)
+        except RuntimeError:
+            cache_enabled = False
+        if cache_enabled:
+            cmds.evaluator(name='cache', enable=False)
+        try:
+            for full_attr, new_path in relinks:
+                try:
+                    cmds.setAttr(full_attr, new_path, type="string")
+                    stats['relink'] += 1
+                    print(f"   [RELINK] {full_attr} -> {new_path}")
+                except Exception as e:
+                    print(f"   !! Relink failed for {full_attr}: {e}")
+        finally:
+            if cache_enabled:
+                cmds.evaluator(name='cache', enable=True)
+            cmds.undoInfo(stateWithoutFlush=undo_state)
+            cmds.flushUndo()
+
+        # Final Scan of Destination (debug only: set HAL_TEX_VERBOSE)
+        if os.environ.get('HAL_TEX_VERBOSE'):
+            print("\n" + "="*60)
+            print("FINAL VERIFICATION")
+            try:
+                with os.scandir(target_dir) as it:
+                    dest_count = sum(1 for _ in it)
+                print(f"Destination now contains {dest_count} files.")
+            except:
+                pass
+            print("="*60 + "\n")
 
         msg = (
             f"✅ Process Complete!\n\n"
             f"Files Copied: {stats['copy']}\n"
+            f"Files Skipped (already up to date): {stats['skip']}\n"
             f"Nodes Relinked: {stats['relink']}\n"
             f"Errors: {stats['error']}\n\n"
             f"Check Script Editor for detailed logs."
@@ -16,22 +16,17 @@ def open_heavy_mode():
     except: pass
 
     # 2) Viewport回到常用：开选择高亮，基本着色，开双面光；阴影默认关
+    view_flags = dict(displayTextures=True, shadows=False, displayLights='default',
+                      twoSidedLighting=True, wireframeOnShaded=False, sel=True,
+                      displayAppearance='smoothShaded')
     panels = cmds.getPanel(type='modelPanel') or []
     for p in panels:
-        try: cmds.modelEditor(p, e=True, displayTextures=True)
-        except: pass
-        try: cmds.modelEditor(p, e=True, shadows=False)
-        except: pass
-        try: cmds.modelEditor(p, e=True, displayLights='default')
-        except: pass
-        try: cmds.modelEditor(p, e=True, twoSidedLighting=True)
-        except: pass
-        try: cmds.modelEditor(p, e=True, wireframeOnShaded=False)
-        except: pass
-        try: cmds.modelEditor(p, e=True, sel=True)
-        except: pass
-        try: cmds.modelEditor(p, e=True, displayAppearance='smoothShaded')
-        except: pass
+        # 每个面板一次 modelEditor 调用；失败时再逐项设置，保证其余选项生效
+        try: cmds.modelEditor(p, e=True, **view_flags)
+        except:
+            for flag, value in view_flags.items():
+                try: cmds.modelEditor(p, e=True, **{flag: value})
+                except: pass
 
     # 3) 关闭包围盒（恢复正常显示）
     try: cmds.displayPref(displayBoundingBox=False)
@@ -1,33 +1,43 @@
 """Layout publishing tool with Qt UI for Maya."""
 import os
 import sys
+import json
 import importlib
 import subprocess
 import re
+from concurrent.futures import ThreadPoolExecutor
 import maya.cmds as cmds
 import maya.utils as utils
 import maya.mel as mel
 import maya.OpenMayaUI as omui
-from PySide2 import QtWidgets, QtCore, QtUiTools
+from PySide2 import QtWidgets, QtCore
 from PySide2.QtWidgets import QMainWindow, QMessageBox, QWidget
-from shiboken2 import wrapInstance
 
-# Import ShotgunDataManager class
-from ..utils.SGlogin import ShotgunDataManager
+# QtUiTools, shiboken2 and ShotgunDataManager (shotgun_api3) are imported where
+# they are first used, so loading this module stays cheap.
 
 # ==============================================================================
 # Import modified Alembic export function
 # ==============================================================================
 from ..utils.exportABC import export_abc
 
+_version_re = re.compile(r'v(\d{3,})', re.IGNORECASE)
+_path_split_re = re.compile(r"[\\/]")
+
+# Source mtimes at (re)load; a dev reload is skipped while neither file has changed
+_SOURCE_FILES = (__file__, sys.modules[export_abc.__module__].__file__)
+_LOADED_MTIMES = tuple(os.path.getmtime(p) for p in _SOURCE_FILES)
+
 
 def maya_main_window():
     """Get Maya's main window as a parent widget."""
+    from shiboken2 import wrapInstance
     ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(ptr), QWidget)
 
 def load_ui(ui_file):
     """Load UI file with error handling"""
+    from PySide2 import QtUiTools
     loader = QtUiTools.QUiLoader()
     file = QtCore.QFile(ui_file)
     if not file.open(QtCore.QFile.ReadOnly):
@@ -36,12 +46,87 @@ def load_ui(ui_file):
     file.close()
     return ui
 
+def _convert_usdc_to_usda(usdc_path, usda_path):
+    """Re-serialise an exported .usdc layer as .usda. Pure USD, no Maya calls."""
+    from pxr import Sdf
+    layer = Sdf.Layer.FindOrOpen(usdc_path)
+    if layer is None or not layer.Export(usda_path):
+        raise RuntimeError(f"Could not convert {usdc_path} to {usda_path}")
+
+def _export_usd(path, start_frame, end_frame, fmt):
+    """usdc and usda share every setting except the file format."""
+    cmds.mayaUSDExport(
+        f=path,
+        selection=True,
+        defaultUSDFormat=fmt,
+        shadingMode="none",
+        defaultMeshScheme="none",
+        frameRange=(start_frame, end_frame),
+        frameStride=1
+    )
+
+def _export_abc(path, start_frame, end_frame, fmt):
+    print(f"Calling Alembic exporter for path: {path} with frame range: {start_frame}-{end_frame}")
+    export_abc(path, start_frame, end_frame)
+
+def _export_obj(path, start_frame, end_frame, fmt):
+    """OBJ has no animation: exports the start frame only."""
+    cmds.currentTime(start_frame)
+    cmds.file(path, force=True, options="groups=1;ptgroups=1;materials=1;smoothing=1;normals=1", 
+              type="OBJexport", exportSelected=True)
+
+# Publish format -> exporter(path, start_frame, end_frame, fmt)
+_EXPORTERS = {
+    "usdc": _export_usd,
+    "usda": _export_usd,
+    "abc": _export_abc,
+    "obj": _export_obj,
+}
+
+class _UploadSignals(QtCore.QObject):
+    """Emitted from the upload worker; Qt queues them onto the GUI thread."""
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+
+class SGUploadTask(QtCore.QRunnable):
+    """
+    Create the ShotGrid Version (network only, no Maya calls) on a pool thread.
+    Uses its own ShotgunDataManager: shotgun_api3 connections are not thread-safe,
+    and the window's one stays in use on the GUI thread.
+    """
+    def __init__(self, thumbnail_path, export_path, first_frame, last_frame):
+        super().__init__()
+        self.signals = _UploadSignals()
+        self.thumbnail_path = thumbnail_path
+        self.export_path = export_path
+        self.first_frame = first_frame
+        self.last_frame = last_frame
+
+    def run(self):
+        try:
+            from ..utils.SGlogin import ShotgunDataManager
+            ShotgunDataManager().Create_SG_Version(self.thumbnail_path, self.export_path,
+                                                   self.first_frame, self.last_frame)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.thumbnail_path)
+
 class PublishToolWindow(QMainWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.resize(680, 610)
         self.setWindowTitle("Layout Publish Tool")
 
+        # HAL context does not change while the window is open; read it once
+        self._env = {k: os.environ.get(k, "") for k in (
+            "HAL_ASSET", "HAL_SEQUENCE", "HAL_SHOT", "HAL_TASK", "HAL_TASK_ROOT",
+            "HAL_TASK_OUTPUT_ROOT", "HAL_PROJECT_ABBR", "HAL_USER_ABBR")}
+        # Library tasks publish under the asset name instead of sequence/shot
+        self._is_library_task = "_library" in _path_split_re.split(self._env["HAL_TASK_ROOT"])
+        # Forward-slash publish folder; publish and thumbnail paths are built from it directly
+        self._publish_dir_posix = f"{self._env['HAL_TASK_ROOT'].replace(os.sep, '/')}/_publish"
+
         # Load UI file
         script_dir = os.path.dirname(os.path.abspath(__file__))
         maya_menu_dir = os.path.dirname(script_dir)  # Go up to mayaMenuBar
@@ -70,8 +155,14 @@ class PublishToolWindow(QMainWindow):
         self.ui.PublishInfoButton.clicked.connect(self.publish)
         self.ui.SGframeImport.clicked.connect(self.set_sg_frame_range)
 
+        # Running ShotGrid uploads, kept referenced until they report back
+        self._uploads = []
+        # (publish dir, dir mtime_ns, highest version) from the last scan
+        self._version_cache = None
+
         # --- ShotgunDataManager Initialization ---
         try:
+            from ..utils.SGlogin import ShotgunDataManager
             self.sg_manager = ShotgunDataManager()
         except Exception as e:
             QMessageBox.critical(self, "Shotgun Connection Error", 
@@ -82,19 +173,27 @@ class PublishToolWindow(QMainWindow):
 
     def open_project_folder(self):
         """Open Windows Explorer at specified project path"""
-        HAL_TASK_ROOT = os.environ.get("HAL_TASK_ROOT", "")
+        HAL_TASK_ROOT = self._env["HAL_TASK_ROOT"]
         project_path = HAL_TASK_ROOT
         try:
-            subprocess.Popen(f'explorer "{project_path}"')
+            # Shell association API directly, no explorer process or argument quoting
+            if sys.platform.startswith("win"):
+                os.startfile(project_path)
+            else:
+                subprocess.Popen(["xdg-open", project_path])
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open folder:\n{str(e)}")
 
     def Open_Playblast_Folder(self):
         """Open Windows Explorer at specified project path"""
-        HAL_TASK_OUTPUT_ROOT = os.environ.get("HAL_TASK_OUTPUT_ROOT", "")
+        HAL_TASK_OUTPUT_ROOT = self._env["HAL_TASK_OUTPUT_ROOT"]
         project_path = f"{HAL_TASK_OUTPUT_ROOT}\\playblast"
         try:
-            subprocess.Popen(f'explorer "{project_path}"')
+            # Shell association API directly, no explorer process or argument quoting
+            if sys.platform.startswith("win"):
+                os.startfile(project_path)
+            else:
+                subprocess.Popen(["xdg-open", project_path])
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open folder:\n{str(e)}")
 
@@ -110,40 +209,39 @@ class PublishToolWindow(QMainWindow):
         cmds.inViewMessage(msg="Unused shaders removed", pos="topLeft", fade=True)
 
     def name_space_checking(self):
-        selected = cmds.ls(sl=True)
+        selected = cmds.ls(sl=True, long=True)
         if not selected:
             cmds.warning("Please select top group")
             return
-            
-        has_namespace = False
-        for top_grp in selected:
-            all_objs = cmds.listRelatives(top_grp, allDescendents=True, fullPath=True) or []
-            all_objs.append(top_grp)
-            for obj in all_objs:
-                if ':' in obj:
-                    has_namespace = True
-                    break
-            if has_namespace:
-                break
+
+        # One traversal: collect every node whose own name carries a namespace
+        all_objs = cmds.listRelatives(selected, allDescendents=True, fullPath=True) or []
+        all_objs.extend(selected)
+        to_clean = {obj for obj in all_objs if ':' in obj.rpartition('|')[2]}
                 
-        if not has_namespace:
+        if not to_clean:
             cmds.inViewMessage(msg="No namespaces found", pos="topLeft", fade=True)
             return
-            
+
+        # Deepest first, so renaming a node never invalidates a path still to be renamed.
+        # No viewport refresh or evaluation graph rebuilds while renaming; the prior
+        # evaluation mode is restored afterwards.
         cleaned = 0
-        for obj in selected:
-            if ':' in obj:
-                _, _, clean_name = obj.rpartition(':')
+        eval_mode = (cmds.evaluationManager(q=True, mode=True) or [None])[0]
+        cmds.undoInfo(openChunk=True)
+        cmds.refresh(suspend=True)
+        if eval_mode and eval_mode != 'off':
+            cmds.evaluationManager(mode='off')
+        try:
+            for obj in sorted(to_clean, key=lambda p: p.count('|'), reverse=True):
+                clean_name = obj.rpartition('|')[2].rpartition(':')[2]
                 cmds.rename(obj, clean_name)
                 cleaned += 1
-                obj = clean_name
-                
-            children = cmds.listRelatives(obj, allDescendents=True, fullPath=True) or []
-            for child in children:
-                if ':' in child:
-                    _, _, clean_child = child.rpartition(':')
-                    cmds.rename(child, clean_child)
-                    cleaned += 1
+        finally:
+            if eval_mode and eval_mode != 'off':
+                cmds.evaluationManager(mode=eval_mode)
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
                     
         cmds.inViewMessage(msg=f"Cleaned {cleaned} namespaces", pos="topLeft", fade=True)
 
@@ -208,6 +306,9 @@ class PublishToolWindow(QMainWindow):
     def auto_save_scene(self):
         try:
             current_file = cmds.file(q=True, sn=True)
+            # Nothing to write: the file on disk already matches the scene
+            if current_file and not cmds.file(q=True, modified=True):
+                return True
             if not current_file:
                 cmds.file(rename="untitled.ma")
             cmds.file(save=True, type='mayaAscii')
@@ -229,10 +330,12 @@ class PublishToolWindow(QMainWindow):
             QMessageBox.warning(self, "Publish Warning", "Please select top-level groups to publish!")
             return
 
-        for obj in original_selection:
-            if cmds.listRelatives(obj, parent=True):
-                QMessageBox.warning(self, "Publish Warning", f"Selected object '{obj}' is not top-level (has parent)")
-                return
+        # Long names of top-level DAG nodes are "|name", so no Maya query is needed
+        non_top = [obj for obj in original_selection if obj.count('|') > 1]
+        if non_top:
+            QMessageBox.warning(self, "Publish Warning",
+                                "Selected objects are not top-level (have parent):\n" + "\n".join(non_top))
+            return
 
         selected_formats = []
         if self.ui.USDCTag.isChecked():
@@ -254,12 +357,31 @@ class PublishToolWindow(QMainWindow):
             next_version = self.get_next_version()
             
             self.export_paths = []
-            for fmt in selected_formats:
-                # Restore original selection before each export
-                cmds.select(original_selection, replace=True)
-                export_path = self.get_publish_path(fmt, next_version).replace(os.sep,"/")
-                self.export_file(fmt, export_path, start_frame, end_frame)
-                self.export_paths.append(export_path)
+            usdc_path = None
+            usda_job = None
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                for fmt in selected_formats:
+                    export_path = self.get_publish_path(fmt, next_version)
+                    if fmt == "usda" and usdc_path:
+                        # Same settings as the .usdc: convert it in the background while
+                        # the remaining Maya exports run instead of exporting again
+                        usda_job = (export_path, pool.submit(_convert_usdc_to_usda, usdc_path, export_path))
+                    else:
+                        # Restore original selection before each export
+                        cmds.select(original_selection, replace=True)
+                        self.export_file(fmt, export_path, start_frame, end_frame)
+                        if fmt == "usdc":
+                            usdc_path = export_path
+                    self.export_paths.append(export_path)
+
+                if usda_job:
+                    usda_path, future = usda_job
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"USDA conversion failed ({e}), exporting it from Maya instead")
+                        cmds.select(original_selection, replace=True)
+                        self.export_file("usda", usda_path, start_frame, end_frame)
 
             if self.export_paths:
                 self.create_and_submit_thumbnail(start_frame, next_version)
@@ -273,53 +395,42 @@ class PublishToolWindow(QMainWindow):
             QMessageBox.critical(self, "Publish Failed", f"Error during publish: {str(e)}")
 
     def get_next_version(self):
-        publish_path = os.path.join(os.environ.get("HAL_TASK_ROOT", ""), "_publish")
-        if not os.path.exists(publish_path):
+        publish_path = os.path.join(self._env["HAL_TASK_ROOT"], "_publish")
+        try:
+            mtime = os.stat(publish_path).st_mtime_ns
+        except OSError:
             return "v001"
 
-        files = [f for f in os.listdir(publish_path) 
-                 if os.path.isfile(os.path.join(publish_path, f))]
-
-        version_pattern = re.compile(r'v(\d{3,})', re.IGNORECASE)
-        max_version = 0
-
-        for filename in files:
-            base_name = os.path.splitext(filename)[0]
-            match = version_pattern.search(base_name)
-            if match:
-                version_num = int(match.group(1))
-                if version_num > max_version:
-                    max_version = version_num
+        # Rescan only when the folder has changed since the last publish
+        cache = self._version_cache
+        if cache and cache[0] == publish_path and cache[1] == mtime:
+            max_version = cache[2]
+        else:
+            max_version = 0
+            # DirEntry.is_file() uses the type cached by the directory listing
+            with os.scandir(publish_path) as it:
+                for entry in it:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    match = _version_re.search(os.path.splitext(entry.name)[0])
+                    if match:
+                        max_version = max(max_version, int(match.group(1)))
+            self._version_cache = (publish_path, mtime, max_version)
 
         next_version = max_version + 1
         return f"v{next_version:03d}"
 
     def get_publish_path(self, fmt, version):
-        publish_folder = "_publish"
-        HAL_ASSET = os.environ.get("HAL_ASSET", "")
-        HAL_SEQUENCE = os.environ.get("HAL_SEQUENCE", "")
-        HAL_SHOT = os.environ.get("HAL_SHOT", "")
-        HAL_TASK = os.environ.get("HAL_TASK", "")
-        HAL_TASK_ROOT = os.environ.get("HAL_TASK_ROOT", "")
-        HAL_PROJECT_ABBR = os.environ.get("HAL_PROJECT_ABBR", "")
-        HAL_USER_ABBR = os.environ.get("HAL_USER_ABBR", "")
-
-        if not HAL_TASK_ROOT:
+        env = self._env
+        if not env["HAL_TASK_ROOT"]:
             raise RuntimeError("HAL_TASK_ROOT environment variable not set")
 
-        path_segments = re.split(r"[\\/]", HAL_TASK_ROOT)
-        if "_library" in path_segments:
-            return os.path.join(
-                HAL_TASK_ROOT,
-                publish_folder,
-                f"{HAL_PROJECT_ABBR}_{HAL_ASSET}_{HAL_TASK}_{version}_{HAL_USER_ABBR}.{fmt}"
-            )
+        if self._is_library_task:
+            name = env["HAL_ASSET"]
         else:
-            return os.path.join(
-                HAL_TASK_ROOT,
-                publish_folder,
-                f"{HAL_PROJECT_ABBR}_{HAL_SEQUENCE}_{HAL_SHOT}_{HAL_TASK}_{version}_{HAL_USER_ABBR}.{fmt}"
-            )
+            name = f"{env['HAL_SEQUENCE']}_{env['HAL_SHOT']}"
+        return (f"{self._publish_dir_posix}/{env['HAL_PROJECT_ABBR']}_{name}_"
+                f"{env['HAL_TASK']}_{version}_{env['HAL_USER_ABBR']}.{fmt}")
 
     def create_and_submit_thumbnail(self, start_frame, version):
         """Create thumbnail and submit to ShotGrid"""
@@ -328,22 +439,21 @@ class PublishToolWindow(QMainWindow):
             return
 
         try:
-            HAL_TASK_ROOT = os.environ.get("HAL_TASK_ROOT", "")
+            HAL_TASK_ROOT = self._env["HAL_TASK_ROOT"]
             if not HAL_TASK_ROOT:
                 QMessageBox.warning(self, "Error", "HAL_TASK_ROOT environment variable not set")
                 return
             
-            HAL_PROJECT_ABBR = os.environ.get("HAL_PROJECT_ABBR", "")
-            HAL_SEQUENCE = os.environ.get("HAL_SEQUENCE", "")
-            HAL_SHOT = os.environ.get("HAL_SHOT", "")
-            HAL_TASK = os.environ.get("HAL_TASK", "")
-            HAL_USER_ABBR = os.environ.get("HAL_USER_ABBR", "")
+            HAL_PROJECT_ABBR = self._env["HAL_PROJECT_ABBR"]
+            HAL_SEQUENCE = self._env["HAL_SEQUENCE"]
+            HAL_SHOT = self._env["HAL_SHOT"]
+            HAL_TASK = self._env["HAL_TASK"]
+            HAL_USER_ABBR = self._env["HAL_USER_ABBR"]
 
-            thumb_dir = os.path.join(HAL_TASK_ROOT, "_publish", "_SGthumbnail")
+            thumb_dir = f"{self._publish_dir_posix}/_SGthumbnail"
             os.makedirs(thumb_dir, exist_ok=True)
             
-            thumb_name = f"{HAL_PROJECT_ABBR}_{HAL_SEQUENCE}_{HAL_SHOT}_{HAL_TASK}_{version}_{HAL_USER_ABBR}_temp"
-            thumb_path = os.path.join(thumb_dir, thumb_name).replace("\\", "/")
+            thumb_path = f"{thumb_dir}/{HAL_PROJECT_ABBR}_{HAL_SEQUENCE}_{HAL_SHOT}_{HAL_TASK}_{version}_{HAL_USER_ABBR}_temp"
             
             cmds.playblast(
                 filename=thumb_path,
@@ -362,62 +472,74 @@ class PublishToolWindow(QMainWindow):
             
             final_path = f"{thumb_path}.{str(start_frame).zfill(4)}.png"
             
-            # Convert paths list to string representation for Shotgun API
-            fileExportPath = str(self.export_paths) if self.export_paths else None
+            # JSON array string for the Shotgun text field; parses back without literal_eval
+            fileExportPath = json.dumps(self.export_paths) if self.export_paths else None
 
             end_frame = int(self.ui.endFrameEdit_2.text())
-            self.sg_manager.Create_SG_Version(final_path, fileExportPath, start_frame, end_frame)
+
+            # Playblast stays on the main thread (Maya API); only the upload runs on the pool
+            task = SGUploadTask(final_path, fileExportPath, start_frame, end_frame)
+            # Bound slots on this window, so the results are delivered on the GUI thread
+            task.signals.finished.connect(self._on_upload_finished)
+            task.signals.failed.connect(self._on_upload_failed)
+            self._uploads.append(task)
+            # One Version at a time: a second publish would pick the same Version code
+            self.ui.PublishInfoButton.setEnabled(False)
+            QtCore.QThreadPool.globalInstance().start(task)
             
         except Exception as e:
             QMessageBox.warning(self, "Thumbnail Warning", f"Could not create/submit thumbnail:\n{str(e)}")
 
+    def _forget_upload(self):
+        """Drop the task whose signals object emitted the current slot."""
+        sender = self.sender()
+        self._uploads = [t for t in self._uploads if t.signals is not sender]
+        if not self._uploads:
+            self.ui.PublishInfoButton.setEnabled(True)
+
+    def _on_upload_finished(self, thumbnail_path):
+        self._forget_upload()
+        QMessageBox.information(self, "ShotGrid", f"ShotGrid Version created.\nThumbnail: {thumbnail_path}")
+
+    def _on_upload_failed(self, error):
+        self._forget_upload()
+        QMessageBox.warning(self, "Thumbnail Warning", f"Could not create/submit thumbnail:\n{error}")
+
     def export_file(self, fmt, path, start_frame, end_frame):
         """
         Main export function that dispatches to the correct exporter
         based on the selected format.
         """
-        if fmt == "usdc":
-            cmds.mayaUSDExport(
-                f=path,
-                selection=True,
-                defaultUSDFormat="usdc",
-                shadingMode="none",
-                defaultMeshScheme="none",
-                frameRange=(start_frame, end_frame),
-                frameStride=1
-            )
-        elif fmt == "usda":
-            cmds.mayaUSDExport(
-                f=path,
-                selection=True,
-                defaultUSDFormat="usda",
-                shadingMode="none",
-                defaultMeshScheme="none",
-                frameRange=(start_frame, end_frame),
-                frameStride=1
-            )
-        elif fmt == "abc":
-            print(f"Calling Alembic exporter for path: {path} with frame range: {start_frame}-{end_frame}")
-            export_abc(path, start_frame, end_frame)
-        elif fmt == "obj":
+        exporter = _EXPORTERS.get(fmt)
+        if exporter is None:
+            return
+        if fmt == "obj":
             QMessageBox.warning(self, "Warning", "OBJ format doesn't support animation export. Exporting current frame only.")
-            cmds.currentTime(start_frame)
-            cmds.file(path, force=True, options="groups=1;ptgroups=1;materials=1;smoothing=1;normals=1", 
-                      type="OBJexport", exportSelected=True)
+        exporter(path, start_frame, end_frame, fmt)
+
+# Reused across menu clicks so layout_publish_tool.ui is only parsed once per session
+_window = None
 
 def get_command():
     def _command():
+        global _window
+        from shiboken2 import isValid
+        if _window is None or not isValid(_window):
+            _window = PublishToolWindow(parent=maya_main_window())
+        _window.show()
+        _window.raise_()
+        _window.activateWindow()
+    return _command
+
+def execute():
+    # Reload only while developing; set MAYADY_DEV_RELOAD to pick up source edits
+    if (os.environ.get("MAYADY_DEV_RELOAD")
+            and tuple(os.path.getmtime(p) for p in _SOURCE_FILES) != _LOADED_MTIMES):
         try:
-            importlib.reload(sys.modules['mayaMenuBar.utils.exportABC'])
+            if 'mayaMenuBar.utils.exportABC' in sys.modules:
+                importlib.reload(sys.modules['mayaMenuBar.utils.exportABC'])
             importlib.reload(sys.modules[__name__])
         except Exception as e:
             print(f"Could not reload modules: {e}")
-            
-        window = PublishToolWindow(parent=maya_main_window())
-        window.show()
-    return _command
-
-def execute():
-    importlib.reload(sys.modules[__name__])
     cmd = get_command()
     cmd()
@@ -10,15 +10,12 @@ import maya.mel as mel
 import maya.OpenMayaUI as omui
 from PySide2 import QtWidgets, QtCore, QtUiTools
 from PySide2.QtWidgets import QMainWindow, QMessageBox, QWidget
-from shiboken2 import wrapInstance
+from shiboken2 import wrapInstance, isValid
 
-# Import ShotgunDataManager class
-from ..utils.SGlogin import ShotgunDataManager
+# ShotgunDataManager (shotgun_api3) and export_abc are imported where they are
+# first used, so loading this module stays cheap.
 
-# ==============================================================================
-# Import modified Alembic export function
-# ==============================================================================
-from ..utils.exportABC import export_abc
+_version_re = re.compile(r'v(\d{3,})', re.IGNORECASE)
 
 
 def maya_main_window():
@@ -42,6 +39,12 @@ class PublishToolWindow(QMainWindow):
         self.resize(680, 400)
         self.setWindowTitle("Match Move Publish Tool")
 
+        # HAL context does not change while the window is open; read it once
+        self._env = {k: os.environ.get(k, "") for k in (
+            "HAL_ASSET", "HAL_SEQUENCE", "HAL_SHOT", "HAL_TASK",
+            "HAL_TASK_ROOT", "HAL_PROJECT_ABBR", "HAL_USER_ABBR")}
+        self._publish_paths = {}  # (fmt, version) -> publish path
+
         # Load UI file
         script_dir = os.path.dirname(os.path.abspath(__file__))
         maya_menu_dir = os.path.dirname(script_dir)  # Go up to mayaMenuBar
@@ -68,6 +71,7 @@ class PublishToolWindow(QMainWindow):
 
         # --- ShotgunDataManager Initialization ---
         try:
+            from ..utils.SGlogin import ShotgunDataManager
             self.sg_manager = ShotgunDataManager()
         except Exception as e:
             QMessageBox.critical(self, "Shotgun Connection Error", 
@@ -103,40 +107,32 @@ class PublishToolWindow(QMainWindow):
         cmds.inViewMessage(msg="Unused shaders removed", pos="topLeft", fade=True)
 
     def name_space_checking(self):
-        selected = cmds.ls(sl=True)
+        selected = cmds.ls(sl=True, long=True)
         if not selected:
             cmds.warning("Please select top group")
             return
-            
-        has_namespace = False
+
+        # One traversal: collect every node whose own name carries a namespace
+        to_clean = set()
         for top_grp in selected:
             all_objs = cmds.listRelatives(top_grp, allDescendents=True, fullPath=True) or []
             all_objs.append(top_grp)
-            for obj in all_objs:
-                if ':' in obj:
-                    has_namespace = True
-                    break
-            if has_namespace:
-                break
+            to_clean.update(obj for obj in all_objs if ':' in obj.rpartition('|')[2])
                 
-        if not has_namespace:
+        if not to_clean:
             cmds.inViewMessage(msg="No namespaces found", pos="topLeft", fade=True)
             return
-            
+
+        # Deepest first, so renaming a node never invalidates a path still to be renamed
         cleaned = 0
-        for obj in selected:
-            if ':' in obj:
-                _, _, clean_name = obj.rpartition(':')
+        cmds.undoInfo(openChunk=True)
+        try:
+            for obj in sorted(to_clean, key=lambda p: p.count('|'), reverse=True):
+                clean_name = obj.rpartition('|')[2].rpartition(':')[2]
                 cmds.rename(obj, clean_name)
                 cleaned += 1
-                obj = clean_name
-                
-            children = cmds.listRelatives(obj, allDescendents=True, fullPath=True) or []
-            for child in children:
-                if ':' in child:
-                    _, _, clean_child = child.rpartition(':')
-                    cmds.rename(child, clean_child)
-                    cleaned += 1
+        finally:
+            cmds.undoInfo(closeChunk=True)
                     
         cmds.inViewMessage(msg=f"Cleaned {cleaned} namespaces", pos="topLeft", fade=True)
 
@@ -200,9 +196,8 @@ class PublishToolWindow(QMainWindow):
 
     def validate_camera_selection(self):
         """Validate that at least one camera is selected"""
-        selected = cmds.ls(sl=True) or []
-        cameras = [obj for obj in selected if cmds.objectType(obj) == 'camera' or 
-                 cmds.listRelatives(obj, allDescendents=True, type='camera')]
+        # One DAG walk over the selection and everything below it, cameras only
+        cameras = cmds.ls(sl=True, dag=True, type='camera')
         if not cameras:
             QMessageBox.warning(self, "Error", "Please select at least one camera for match move export")
             return False
@@ -235,8 +230,9 @@ class PublishToolWindow(QMainWindow):
         if not self.validate_camera_selection():
             return
             
+        # Long names of top-level DAG nodes are "|name", so no Maya query is needed
         for obj in original_selection:
-            if cmds.listRelatives(obj, parent=True):
+            if obj.count('|') > 1:
                 QMessageBox.warning(self, "Publish Warning", f"Selected object '{obj}' is not top-level (has parent)")
                 return
 
@@ -247,7 +243,7 @@ class PublishToolWindow(QMainWindow):
             
             # Restore original selection before export
             cmds.select(original_selection, replace=True)
-            export_path = self.get_publish_path("abc", next_version).replace(os.sep,"/")
+            export_path = self.get_publish_path("abc", next_version)
             self.export_file(export_path, start_frame, end_frame)
             
             self.create_and_submit_thumbnail(start_frame, next_version)
@@ -261,53 +257,57 @@ class PublishToolWindow(QMainWindow):
             QMessageBox.critical(self, "Publish Failed", f"Error during publish: {str(e)}")
 
     def get_next_version(self):
-        publish_path = os.path.join(os.environ.get("HAL_TASK_ROOT", ""), "_publish")
+        publish_path = os.path.join(self._env["HAL_TASK_ROOT"], "_publish")
         if not os.path.exists(publish_path):
             return "v001"
 
-        files = [f for f in os.listdir(publish_path) 
-                 if os.path.isfile(os.path.join(publish_path, f))]
-
-        version_pattern = re.compile(r'v(\d{3,})', re.IGNORECASE)
         max_version = 0
-
-        for filename in files:
-            base_name = os.path.splitext(filename)[0]
-            match = version_pattern.search(base_name)
-            if match:
-                version_num = int(match.group(1))
-                if version_num > max_version:
-                    max_version = version_num
+        # DirEntry.is_file() uses the type cached by the directory listing
+        with os.scandir(publish_path) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                match = _version_re.search(os.path.splitext(entry.name)[0])
+                if match:
+                    max_version = max(max_version, int(match.group(1)))
 
         next_version = max_version + 1
         return f"v{next_version:03d}"
 
     def get_publish_path(self, fmt, version):
+        cached = self._publish_paths.get((fmt, version))
+        if cached:
+            return cached
+
         publish_folder = "_publish"
-        HAL_ASSET = os.environ.get("HAL_ASSET", "")
-        HAL_SEQUENCE = os.environ.get("HAL_SEQUENCE", "")
-        HAL_SHOT = os.environ.get("HAL_SHOT", "")
-        HAL_TASK = os.environ.get("HAL_TASK", "")
-        HAL_TASK_ROOT = os.environ.get("HAL_TASK_ROOT", "")
-        HAL_PROJECT_ABBR = os.environ.get("HAL_PROJECT_ABBR", "")
-        HAL_USER_ABBR = os.environ.get("HAL_USER_ABBR", "")
+        HAL_ASSET = self._env["HAL_ASSET"]
+        HAL_SEQUENCE = self._env["HAL_SEQUENCE"]
+        HAL_SHOT = self._env["HAL_SHOT"]
+        HAL_TASK = self._env["HAL_TASK"]
+        HAL_TASK_ROOT = self._env["HAL_TASK_ROOT"]
+        HAL_PROJECT_ABBR = self._env["HAL_PROJECT_ABBR"]
+        HAL_USER_ABBR = self._env["HAL_USER_ABBR"]
 
         if not HAL_TASK_ROOT:
             raise RuntimeError("HAL_TASK_ROOT environment variable not set")
 
-        path_segments = re.split(r"[\\/]", HAL_TASK_ROOT)
+        path_segments = HAL_TASK_ROOT.replace('\\', '/').split('/')
         if "_library" in path_segments:
-            return os.path.join(
+            path = os.path.join(
                 HAL_TASK_ROOT,
                 publish_folder,
                 f"{HAL_PROJECT_ABBR}_{HAL_ASSET}_{HAL_TASK}_{version}_{HAL_USER_ABBR}.{fmt}"
             )
         else:
-            return os.path.join(
+            path = os.path.join(
                 HAL_TASK_ROOT,
                 publish_folder,
                 f"{HAL_PROJECT_ABBR}_{HAL_SEQUENCE}_{HAL_SHOT}_{HAL_TASK}_{version}_{HAL_USER_ABBR}.{fmt}"
             )
+        # Normalised once here; callers get the cached forward-slash path
+        path = path.replace(os.sep, "/")
+        self._publish_paths[(fmt, version)] = path
+        return path
 
     def create_and_submit_thumbnail(self, start_frame, version):
         """Create thumbnail and submit to ShotGrid"""
@@ -316,16 +316,16 @@ class PublishToolWindow(QMainWindow):
             return
 
         try:
-            HAL_TASK_ROOT = os.environ.get("HAL_TASK_ROOT", "")
+            HAL_TASK_ROOT = self._env["HAL_TASK_ROOT"]
             if not HAL_TASK_ROOT:
                 QMessageBox.warning(self, "Error", "HAL_TASK_ROOT environment variable not set")
                 return
             
-            HAL_PROJECT_ABBR = os.environ.get("HAL_PROJECT_ABBR", "")
-            HAL_SEQUENCE = os.environ.get("HAL_SEQUENCE", "")
-            HAL_SHOT = os.environ.get("HAL_SHOT", "")
-            HAL_TASK = os.environ.get("HAL_TASK", "")
-            HAL_USER_ABBR = os.environ.get("HAL_USER_ABBR", "")
+            HAL_PROJECT_ABBR = self._env["HAL_PROJECT_ABBR"]
+            HAL_SEQUENCE = self._env["HAL_SEQUENCE"]
+            HAL_SHOT = self._env["HAL_SHOT"]
+            HAL_TASK = self._env["HAL_TASK"]
+            HAL_USER_ABBR = self._env["HAL_USER_ABBR"]
 
             thumb_dir = os.path.join(HAL_TASK_ROOT, "_publish", "_SGthumbnail")
             os.makedirs(thumb_dir, exist_ok=True)
@@ -351,7 +351,7 @@ class PublishToolWindow(QMainWindow):
             final_path = f"{thumb_path}.{str(start_frame).zfill(4)}.png"
             
             # Convert path to string representation for Shotgun API
-            fileExportPath = str(self.get_publish_path("abc", version).replace(os.sep,"/"))
+            fileExportPath = self.get_publish_path("abc", version)
             end_frame = int(self.ui.endFrameEdit_2.text())
             self.sg_manager.Create_SG_Version(final_path, fileExportPath, start_frame, end_frame)
             
@@ -360,22 +360,31 @@ class PublishToolWindow(QMainWindow):
 
     def export_file(self, path, start_frame, end_frame):
         """Export match move data as ABC"""
+        from ..utils.exportABC import export_abc
         print(f"Calling Alembic exporter for path: {path} with frame range: {start_frame}-{end_frame}")
         export_abc(path, start_frame, end_frame)
 
+# Reused across menu clicks so mm_publish_tool.ui is only parsed once per session
+_window = None
+
 def get_command():
     def _command():
+        global _window
+        if _window is None or not isValid(_window):
+            _window = PublishToolWindow(parent=maya_main_window())
+        _window.show()
+        _window.raise_()
+        _window.activateWindow()
+    return _command
+
+def execute():
+    # Reload only while developing; set MAYADY_DEV_RELOAD to pick up source edits
+    if os.environ.get("MAYADY_DEV_RELOAD"):
         try:
-            importlib.reload(sys.modules['mayaMenuBar.utils.exportABC'])
+            if 'mayaMenuBar.utils.exportABC' in sys.modules:
+                importlib.reload(sys.modules['mayaMenuBar.utils.exportABC'])
             importlib.reload(sys.modules[__name__])
         except Exception as e:
             print(f"Could not reload modules: {e}")
-            
-        window = PublishToolWindow(parent=maya_main_window())
-        window.show()
-    return _command
-
-def execute():
-    importlib.reload(sys.modules[__name__])
     cmd = get_command()
     cmd()
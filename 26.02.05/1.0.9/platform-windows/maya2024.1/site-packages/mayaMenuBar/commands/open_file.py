@@ -1,40 +1,51 @@
 """Command to open Maya scene with version browsing."""
 import os
 import re
+import stat
+import time
 import datetime
+from collections import OrderedDict
 import maya.cmds as cmds
 import maya.OpenMayaUI as omui
 from PySide2.QtCore import *
 from PySide2.QtGui import *
 from PySide2.QtWidgets import *
-from shiboken2 import wrapInstance
 import importlib
 import sys
 
+_version_re = re.compile(r"v(\d+)")
+
+# Seconds a cached file stat is trusted; files re-saved in place show up after this
+_STAT_TTL = 2.0
+
+# Source mtime at (re)load; a dev reload is skipped while the file is unchanged
+_LOADED_MTIME = os.path.getmtime(__file__)
+
 def maya_main_window():
     """Get Maya's main window as a parent widget."""
+    from shiboken2 import wrapInstance
     ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(ptr), QWidget)
 
 class OpenSceneWindow(QDialog):
     _instance = None  # Singleton tracker
 
-    def __init__(self, parent=maya_main_window()):
+    def __init__(self, parent=None):
         # Clean up existing instance completely
         if OpenSceneWindow._instance:
             try:
                 OpenSceneWindow._instance.blockSignals(True)
                 OpenSceneWindow._instance.setParent(None)
                 OpenSceneWindow._instance.close()
+                # Deleted by Qt on the next event-loop pass; nothing here depends on it being gone
                 OpenSceneWindow._instance.deleteLater()
-                # Force Qt cleanup
-                QApplication.processEvents()  
             except Exception as e:
                 print(f"Error cleaning up previous instance: {str(e)}")
             finally:
                 OpenSceneWindow._instance = None
 
-        super().__init__(parent)
+        # Resolved per window, not once when the class body runs at import
+        super().__init__(parent or maya_main_window())
         OpenSceneWindow._instance = self
         self.setAttribute(Qt.WA_DeleteOnClose, True)
 
@@ -51,6 +62,9 @@ class OpenSceneWindow(QDialog):
         self.HAL_PROJECT_ABBR = os.environ.get("HAL_PROJECT_ABBR") or "UNK"
         self.HAL_USER_ABBR = os.environ.get("HAL_USER_ABBR") or "user"
 
+        # file path -> (monotonic time, os.stat_result), cleared on every list refresh
+        self._stat_cache = OrderedDict()
+
         # UI Components
         self.file_name_combo = QComboBox()
         self.file_info_text = QTextEdit()
@@ -75,6 +89,12 @@ class OpenSceneWindow(QDialog):
         main_layout.addLayout(btn_layout)
         self.setLayout(main_layout)
 
+        # Coalesce bursts of combo changes (keyboard scrolling) into one file info refresh
+        self._info_timer = QTimer(self)
+        self._info_timer.setSingleShot(True)
+        self._info_timer.setInterval(50)
+        self._info_timer.timeout.connect(self._do_update_file_info)
+
         # Initialize
         self.update_file_list()
         self.file_name_combo.currentIndexChanged.connect(self.update_file_info)
@@ -82,36 +102,53 @@ class OpenSceneWindow(QDialog):
     def get_existing_ma_files(self):
         """Get sorted list of .ma files (newest first) from all users"""
         ma_files = []
-        if not self.HAL_TASK_ROOT or not os.path.isdir(self.HAL_TASK_ROOT):
+        if not self.HAL_TASK_ROOT:
+            return ma_files
+        try:
+            dir_stats = os.stat(self.HAL_TASK_ROOT)
+        except OSError:
+            return ma_files
+        if not stat.S_ISDIR(dir_stats.st_mode):
             return ma_files
 
-        for filename in os.listdir(self.HAL_TASK_ROOT):
-            if filename.lower().endswith(".ma"):
-                # Include all .ma files regardless of HAL_USER_ABBR
-                ma_files.append(filename)
+        # Include all .ma files regardless of HAL_USER_ABBR; DirEntry.is_file() needs no extra stat
+        with os.scandir(self.HAL_TASK_ROOT) as it:
+            ma_files = [e.name for e in it if e.name.lower().endswith(".ma") and e.is_file()]
         
         # Sort by version (newest first)
         def version_sorter(f):
-            match = re.search(r"v(\d+)", f)
-            return int(match.group(1)) if match else 0
-        return sorted(ma_files, key=version_sorter, reverse=True)
+            match = _version_re.search(f)
+            return -int(match.group(1)) if match else 0
+        return sorted(ma_files, key=version_sorter)
 
     def update_file_list(self):
         """Refresh file list in combo box"""
-        self.file_name_combo.clear()
+        # In-place re-saves don't change the folder's mtime, so start from fresh stats
+        self._stat_cache.clear()
         ma_files = self.get_existing_ma_files()
-        
+
+        # No per-item currentIndexChanged while repopulating; info is refreshed once below
+        self.file_name_combo.blockSignals(True)
+        try:
+            self.file_name_combo.clear()
+            if not ma_files:
+                self.file_name_combo.addItem("No .ma files found in HAL_TASK_ROOT")
+            else:
+                self.file_name_combo.addItems(ma_files)
+                self.file_name_combo.setCurrentIndex(0)
+        finally:
+            self.file_name_combo.blockSignals(False)
+
         if not ma_files:
-            self.file_name_combo.addItem("No .ma files found in HAL_TASK_ROOT")
             self.file_info_text.clear()
             return
+        self._do_update_file_info()
 
-        self.file_name_combo.addItems(ma_files)
-        if ma_files:
-            self.file_name_combo.setCurrentIndex(0)
-            self.update_file_info()
+    def update_file_info(self, *args):
+        """Schedule a file info refresh (debounced)"""
+        self._info_timer.start()
 
-    def update_file_info(self):
+    def _do_update_file_info(self):
         """Show file details in text edit"""
         selected_file = self.file_name_combo.currentText()
         if "No .ma files found" in selected_file:
@@ -119,12 +156,26 @@ class OpenSceneWindow(QDialog):
             return
 
         file_path = os.path.join(self.HAL_TASK_ROOT, selected_file)
-        if not os.path.isfile(file_path):
-            self.file_info_text.clear()
-            return
+        now = time.monotonic()
+        cached = self._stat_cache.get(file_path)
+        if cached is not None and now - cached[0] < _STAT_TTL:
+            file_stats = cached[1]
+            self._stat_cache.move_to_end(file_path)
+        else:
+            try:
+                file_stats = os.stat(file_path)
+            except OSError:
+                file_stats = None
+            if file_stats is None or not stat.S_ISREG(file_stats.st_mode):
+                self._stat_cache.pop(file_path, None)
+                self.file_info_text.clear()
+                return
+            self._stat_cache[file_path] = (now, file_stats)
+            self._stat_cache.move_to_end(file_path)
+            if len(self._stat_cache) > 128:
+                self._stat_cache.popitem(last=False)
 
         try:
-            file_stats = os.stat(file_path)
             modified_time = datetime.datetime.fromtimestamp(file_stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
             
             info = [
@@ -134,7 +185,7 @@ class OpenSceneWindow(QDialog):
                 f"Modified: {modified_time}"
             ]
             
-            version_match = re.search(r"v(\d+)", selected_file)
+            version_match = _version_re.search(selected_file)
             if version_match:
                 info.append(f"Version: {version_match.group(0)}")
             
@@ -218,9 +269,8 @@ class OpenSceneWindow(QDialog):
             self.blockSignals(True)
             self.setParent(None)
             OpenSceneWindow._instance = None
+            # WA_DeleteOnClose lets Qt delete the dialog from its own event queue
             super().closeEvent(event)
-            # Force Qt cleanup
-            QApplication.processEvents()
         except Exception as e:
             print(f"Error during window close: {str(e)}")
 
@@ -290,7 +340,8 @@ def get_command():
     return _command
 
 def execute():
-    """Execute the command with reloading."""
-    importlib.reload(sys.modules[__name__])
+    """Execute the command; with MAYADY_DEV_RELOAD set, reload first if the source changed."""
+    if os.environ.get("MAYADY_DEV_RELOAD") and os.path.getmtime(__file__) != _LOADED_MTIME:
+        importlib.reload(sys.modules[__name__])
     cmd = get_command()
     cmd()
@@ -1,18 +1,22 @@
 # -*- coding: utf-8 -*-
+import os
+from collections import defaultdict
 import maya.cmds as cmds
 import maya.api.OpenMaya as om
+import numpy as np
 import importlib
 import sys
 
-def get_dominant_material_via_api(shape_path):
+# 逐个对象的日志开关（默认关闭，避免大场景下大量输出）
+_VERBOSE = False
+
+def get_dominant_material_via_api(dag_path, shape_path):
     """
     使用 API 计算 Shape 上占比最大的材质。
     只返回最强的那个 SG 名字，不再关心比例是否够高。
+    dag_path 直接复用遍历得到的 MDagPath，shape_path 仅用于报错信息。
     """
     try:
-        sel_list = om.MSelectionList()
-        sel_list.add(shape_path)
-        dag_path = sel_list.getDagPath(0)
         mesh_fn = om.MFnMesh(dag_path)
         
         shaders, face_indices = mesh_fn.getConnectedShaders(dag_path.instanceNumber())
@@ -21,26 +25,17 @@ def get_dominant_material_via_api(shape_path):
             
         if len(face_indices) == 0: return None
 
-        # 统计每个 shader 的面数
-        counts = {}
-        for s_idx in face_indices:
-            if s_idx != -1:
-                counts[s_idx] = counts.get(s_idx, 0) + 1
-        
-        if not counts: return None
+        # 统计每个 shader 的面数 (-1 为未指认的面)
+        arr = np.asarray(face_indices, dtype=np.int32)
+        arr = arr[arr >= 0]
+        if arr.size == 0: return None
 
         # 找出最大值
-        best_sg_obj = None
-        max_count = -1
-        
-        for s_idx, count in counts.items():
-            if count > max_count:
-                max_count = count
-                if s_idx < len(shaders):
-                    best_sg_obj = shaders[s_idx]
+        counts = np.bincount(arr, minlength=len(shaders))
+        best = int(counts.argmax())
         
-        if best_sg_obj:
-            return om.MFnDependencyNode(best_sg_obj).name()
+        if best < len(shaders):
+            return om.MFnDependencyNode(shaders[best]).name()
             
     except Exception as e:
         print(f"[API Error] {shape_path}: {e}")
@@ -48,6 +43,31 @@ def get_dominant_material_via_api(shape_path):
     
     return None
 
+def collect_mesh_shapes_via_api(selection):
+    """
+    用 MItDag 遍历选择下的所有 mesh（包括直接选中的 shape），
+    跳过 intermediate shape，返回 (长路径, MDagPath) 列表。
+    """
+    sel_list = om.MSelectionList()
+    for node in selection:
+        sel_list.add(node)
+
+    shapes = []
+    it = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kMesh)
+    for i in range(sel_list.length()):
+        try:
+            root = sel_list.getDagPath(i)
+        except RuntimeError:
+            # 非 DAG 节点
+            continue
+        it.reset(root, om.MItDag.kDepthFirst, om.MFn.kMesh)
+        while not it.isDone():
+            dag_path = it.getPath()
+            if not om.MFnDagNode(dag_path).isIntermediateObject:
+                shapes.append((dag_path.fullPathName(), dag_path))
+            it.next()
+    return shapes
+
 def force_unify_pipeline_materials():
     """
     Pipeline 强制合规脚本。
@@ -57,64 +77,108 @@ def force_unify_pipeline_materials():
     if not selection:
         cmds.warning("请选择资产顶层组！")
         return
+    # 用 API 保存选择，结束时直接恢复，无需再按名字解析
+    sel_api = om.MGlobal.getActiveSelectionList()
 
     print(f"\n{'='*20} PIPELINE FORCE UNIFY START {'='*20}")
     
-    all_shapes = cmds.listRelatives(selection, allDescendents=True, type='mesh', fullPath=True) or []
-    all_shapes.extend(cmds.ls(selection, type='mesh', long=True))
-    all_shapes = list(set(all_shapes))
-    
-    fixed_count = 0
-    
-    for shape in all_shapes:
-        if cmds.getAttr(f"{shape}.intermediateObject"):
-            continue
-
-        parent = cmds.listRelatives(shape, parent=True, fullPath=True)
-        if not parent: continue
-        xform = parent[0]
-        short_name = xform.split('|')[-1]
+    # 批量修复期间暂停视口刷新并关闭 undo 记录
+    was_undo = cmds.undoInfo(q=True, state=True)
+    cmds.refresh(suspend=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        # 收集时直接过滤掉 intermediate shape，按出现顺序去重
+        all_shapes = dict(collect_mesh_shapes_via_api(selection))
 
-        # 1. 检查是否有材质连接 (只要有连接，不管是Shape还是Face，都要处理)
-        connections = cmds.listConnections(shape, type='shadingEngine') or []
-        connections += (cmds.listConnections(f"{shape}.instObjGroups", type='shadingEngine') or [])
-        connections += (cmds.listConnections(f"{shape}.instObjGroups.objectGroups", type='shadingEngine') or [])
+        # 每个 SG 只查询一次成员，反向建立 节点(长路径) -> [SG] 映射
+        # （面级指认的成员是 shape.f[...]，objectsOnly 会归到所属节点上）
+        # 同时记录整体指认（非面级）的节点 -> SG
+        shape_to_sgs = {}
+        whole_sg = {}
+        for sg in cmds.ls(type='shadingEngine') or []:
+            members = cmds.ls(cmds.sets(sg, q=True) or [], long=True) or []
+            whole = [m for m in members if '.' not in m]
+            comps = [m for m in members if '.' in m]
+            nodes = whole + (cmds.ls(comps, long=True, objectsOnly=True) or [] if comps else [])
+            for node in whole:
+                whole_sg[node] = sg
+            for node in nodes:
+                sgs = shape_to_sgs.setdefault(node, [])
+                if sg not in sgs:
+                    sgs.append(sg)
         
-        if not connections:
-            continue
-
-        # 2. 找出“胜者”材质
-        target_sg = get_dominant_material_via_api(shape)
+        fixed_count = 0
+        # 同一个 SG 的 Transform 归到一起，之后每个 SG 只指认一次
+        by_sg = defaultdict(list)
+        # 所有面级断开操作收集到一个 DG modifier 里一次性执行
+        dg_mod = om.MDGModifier()
         
-        if target_sg:
-            try:
+        for shape, dag_path in all_shapes.items():
+            xform = shape.rpartition('|')[0]
+            if not xform: continue
+
+            # 1. 检查是否有材质连接 (只要有连接，不管是Shape还是Face，都要处理)
+            connections = shape_to_sgs.get(shape) or shape_to_sgs.get(xform)
+            
+            if not connections:
+                continue
+
+            # 2. 找出“胜者”材质（只有一个 SG 时无需再用 API 统计面数）
+            target_sg = connections[0] if len(connections) == 1 else get_dominant_material_via_api(dag_path, shape)
+            
+            if target_sg:
+                # 已经整体指认到这个唯一 SG 的，无需重新指认
+                # （只用面级指认到单个 SG 的仍要断开 objectGroups）
+                if len(connections) == 1 and target_sg in (whole_sg.get(shape), whole_sg.get(xform)):
+                    continue
                 # 3. 【关键步骤】物理切断所有面级连接 (GeomSubset 根源)
                 # 即使 Maya sets() 命令有时会自动断开，但显式切断是最安全的
                 plugs = cmds.listConnections(f"{shape}.instObjGroups[0].objectGroups", plugs=True, c=True) or []
-                if plugs:
-                    # print(f"  - Cleaning sub-face connections on {short_name}...")
-                    for i in range(0, len(plugs), 2):
-                        try:
-                            cmds.disconnectAttr(plugs[i], plugs[i+1])
-                        except:
-                            pass
-                
+                for i in range(0, len(plugs), 2):
+                    try:
+                        plug_list = om.MSelectionList()
+                        plug_list.add(plugs[i])
+                        plug_list.add(plugs[i+1])
+                        dg_mod.disconnect(plug_list.getPlug(0), plug_list.getPlug(1))
+                    except:
+                        pass
+                by_sg[target_sg].append(xform)
+
+        dg_mod.doIt()
+
+        for target_sg, xforms in by_sg.items():
+            try:
                 # 4. 强制指认给 Transform
                 # 这会覆盖掉 Mesh 上的一切，只保留这一个材质
-                cmds.sets(xform, forceElement=target_sg)
+                cmds.sets(xforms, forceElement=target_sg)
                 
-                # print(f"[UNIFIED] {short_name} -> {target_sg}")
-                fixed_count += 1
+                if _VERBOSE:
+                    print(f"[UNIFIED] {len(xforms)} objects -> {target_sg}")
+                fixed_count += len(xforms)
                 
-            except Exception as e:
-                print(f"[FAIL] {short_name}: {e}")
+            except Exception:
+                # 批量失败时逐个指认，定位具体失败的对象
+                for xform in xforms:
+                    short_name = xform.split('|')[-1]
+                    try:
+                        cmds.sets(xform, forceElement=target_sg)
+                        if _VERBOSE:
+                            print(f"[UNIFIED] {short_name} -> {target_sg}")
+                        fixed_count += 1
+                    except Exception as e:
+                        print(f"[FAIL] {short_name}: {e}")
+    finally:
+        cmds.undoInfo(stateWithoutFlush=was_undo)
+        # 修复过程没有进入 undo 队列，旧的 undo 记录已与场景不符，清空以免误撤销
+        cmds.flushUndo()
+        cmds.refresh(suspend=False)
+        cmds.refresh(force=True)
 
-    cmds.select(selection, r=True)
+    om.MGlobal.setActiveSelectionList(sel_api)
     print(f"\n{'='*20} DONE {'='*20}")
     
     if fixed_count > 0:
-        cmds.inViewMessage(msg=f"Pipeline 合规化完成！\n强制统一了 {fixed_count} 个对象。", pos="topCenter", fade=True)
-        print(f"Pipeline 合规化完成。强制统一了 {fixed_count} 个对象。")
+        om.MGlobal.displayInfo(f"Pipeline 合规化完成。强制统一了 {fixed_count} 个对象。")
         print("注意：如果对象原本包含设计好的多维材质，次要材质已被移除。")
     else:
         print("未发现需要修复的对象 (可能已经是合规状态)。")
@@ -127,7 +191,8 @@ def get_command():
     return _command
 
 def execute():
-    """Execute the command with reloading."""
-    importlib.reload(sys.modules[__name__])
+    """Execute the command; set MAYADY_DEV_RELOAD to reload this module first."""
+    if os.environ.get("MAYADY_DEV_RELOAD"):
+        importlib.reload(sys.modules[__name__])
     cmd = get_command()
     cmd()
\ No newline at end of file
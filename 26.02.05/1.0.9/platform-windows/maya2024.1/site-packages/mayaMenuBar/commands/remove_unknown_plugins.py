@@ -1,3 +1,4 @@
+import os
 import maya.cmds as cmds
 import importlib
 import sys
@@ -50,47 +51,52 @@ def remove_unknown_plugin_records():
 
 def delete_unknown_nodes():
     deleted = []
-    for t in ("unknown", "unknownDag"):
-        nodes = cmds.ls(type=t) or []
-        for n in nodes:
-            try:
-                cmds.lockNode(n, l=False)
-                cmds.delete(n)
-                deleted.append(n)
-            except Exception as e:
-                print(f"[WARN] Could not delete {t} node '{n}': {e}")
+    # One scene walk for both types
+    nodes = cmds.ls(type=("unknown", "unknownDag")) or []
+    if not nodes:
+        return deleted
+    # Unlock and delete in one call each; fall back to per-node on failure
+    try:
+        cmds.lockNode(nodes, l=False)
+        cmds.delete(nodes)
+        return list(nodes)
+    except Exception:
+        pass
+    for n in nodes:
+        if not cmds.objExists(n):
+            continue
+        try:
+            cmds.lockNode(n, l=False)
+            cmds.delete(n)
+            deleted.append(n)
+        except Exception as e:
+            print(f"[WARN] Could not delete unknown node '{n}': {e}")
     return deleted
 
 def unload_non_core_plugins(whitelist=WHITELIST):
     unloaded = []
-    all_plugs = list_all_plugins()
-    for p in sorted(all_plugs):
+    # listPlugins only reports loaded plugins, so one query replaces a
+    # per-plugin pluginInfo(loaded=True) check
+    loaded = list_all_plugins()
+    # Plugins the scene still uses are left alone along with the whitelist
+    for p in loaded - set(whitelist) - plugins_in_use():
+        # Turn off autoload first (once per plugin)
         try:
-            if p in whitelist:
-                continue
-            if cmds.pluginInfo(p, q=True, loaded=True):
-                # Turn off autoload first
-                try:
-                    cmds.pluginInfo(p, e=True, autoload=False)
-                except Exception:
-                    pass
-                # Then unload
-                cmds.unloadPlugin(p, force=True)
-                unloaded.append(p)
+            cmds.pluginInfo(p, e=True, autoload=False)
         except Exception:
-            # ignore bad/locked plugins
             pass
-        # Also disable autoload for not-loaded plugins outside whitelist
+        # Then unload
         try:
-            if p not in whitelist:
-                cmds.pluginInfo(p, e=True, autoload=False)
+            cmds.unloadPlugin(p, force=True)
+            unloaded.append(p)
         except Exception:
+            # ignore bad/locked plugins
             pass
     return unloaded
 
 def scene_unknowns_summary():
     return {
-        "unknown_nodes": (cmds.ls(type="unknown") or []) + (cmds.ls(type="unknownDag") or []),
+        "unknown_nodes": cmds.ls(type=("unknown", "unknownDag")) or [],
         "unknown_plugin_records": list(list_unknown_plugins()),
         "plugins_in_use": sorted(list(plugins_in_use()))
     }
@@ -125,7 +131,8 @@ def get_command():
     return _command
 
 def execute():
-    """Execute the command with reloading."""
-    importlib.reload(sys.modules[__name__])
+    """Execute the command; set MAYADY_DEV_RELOAD to reload this module first."""
+    if os.environ.get("MAYADY_DEV_RELOAD"):
+        importlib.reload(sys.modules[__name__])
     cmd = get_command()
     cmd()
\ No newline at end of file
@@ -16,12 +16,13 @@ def _execute_command(module_name):
         raise AttributeError(f"Command module '{module_name}' has no callable execute()")
     return execute()
 
-for filename in os.listdir(commands_dir):
-    if filename.endswith('.py') and not filename.startswith('_'):
-        module_name = filename[:-3]
-        if not _module_name_re.match(module_name):
-            continue
-        COMMANDS[module_name] = (lambda mn=module_name: _execute_command(mn))
+with os.scandir(commands_dir) as it:
+    module_names = [e.name[:-3] for e in it
+                    if e.is_file() and e.name.endswith('.py') and not e.name.startswith('_')]
+for module_name in module_names:
+    if not _module_name_re.match(module_name):
+        continue
+    COMMANDS[module_name] = (lambda mn=module_name: _execute_command(mn))
 
 
 def create_menu():
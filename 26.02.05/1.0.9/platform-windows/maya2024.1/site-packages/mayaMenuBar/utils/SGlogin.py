@@ -211,7 +211,11 @@ class ShotgunDataManager:
         return highestVersionCode
 
     def Create_SG_Version(self, thumbnail_path, submit_path=None, first_frame=None, last_frame=None, anim_tag=""):
-        """Create a Shotgun Version, then upload the thumbnail in a separate, stable step."""
+        """Create a Shotgun Version, then upload the thumbnail in a separate, stable step.
+
+        submit_path is stored as-is in sg_path_to_geometry: a single path, or a
+        JSON array string of paths for multi-format publishes.
+        """
         highestVersion = self.SG_Find_Version(anim_tag=anim_tag)
         
         data = {
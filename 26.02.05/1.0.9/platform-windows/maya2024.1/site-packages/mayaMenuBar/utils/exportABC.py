@@ -6,11 +6,28 @@ This script provides a primary function `export_abc` that can be used
 for both animated sequences and static, single-frame exports.
 """
 import os
+import re
 import maya.cmds as cmds
 import maya.mel as mel
 import importlib
 import sys
 
+# Runs of backslashes (mixed-separator Windows paths) collapse to a single '/';
+# a leading UNC '\\' prefix is kept as '//'
+_SEP_RE = re.compile(r'^(\\\\)|\\+')
+
+# Set once AbcExport is confirmed loaded; a loaded plugin stays loaded
+_ABC_LOADED = False
+
+def _ensure_abc():
+    """Load the AbcExport plugin if needed, querying Maya only once per session."""
+    global _ABC_LOADED
+    if _ABC_LOADED:
+        return
+    if not cmds.pluginInfo("AbcExport", query=True, loaded=True):
+        cmds.loadPlugin("AbcExport.mll")
+    _ABC_LOADED = True
+
 def export_abc(path, start_frame, end_frame, include_curves=False, strip_namespaces=True):
     """
     Core function to export the current selection to an Alembic file.
@@ -29,12 +46,11 @@ def export_abc(path, start_frame, end_frame, include_curves=False, strip_namespa
                                            Defaults to True.
     """
     # Ensure Alembic plugin is loaded
-    if not cmds.pluginInfo("AbcExport", query=True, loaded=True):
-        try:
-            cmds.loadPlugin("AbcExport.mll")
-        except RuntimeError as e:
-            cmds.error(f"Failed to load AbcExport plugin: {e}")
-            return
+    try:
+        _ensure_abc()
+    except RuntimeError as e:
+        cmds.error(f"Failed to load AbcExport plugin: {e}")
+        return
 
     # Get the current selection
     selected_nodes = cmds.ls(sl=True, long=True)
@@ -44,41 +60,31 @@ def export_abc(path, start_frame, end_frame, include_curves=False, strip_namespa
 
     # Ensure the output directory exists
     output_dir = os.path.dirname(path)
-    if not os.path.exists(output_dir):
-        try:
-            os.makedirs(output_dir)
-        except OSError as e:
-            cmds.error(f"Could not create directory {output_dir}: {e}")
-            return
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError as e:
+        cmds.error(f"Could not create directory {output_dir}: {e}")
+        return
 
     # --- MEL Command Construction ---
-    path = path.replace('\\', '/')
-    roots_arg = " ".join([f"-root {node}" for node in selected_nodes])
-    
-    # Base arguments
-    job_args = [
-        f"-frameRange {start_frame} {end_frame}",
-        "-uvWrite",
-        "-writeColorSets",
-        "-writeUVSets",
-        "-dataFormat ogawa",
-        roots_arg,
-    ]
+    path = _SEP_RE.sub(lambda m: '//' if m.group(1) else '/', path)
+    # Escape the path once for the nested MEL string
+    escaped_path = path.replace('"', '\\"')
+    roots_arg = " ".join("-root " + node for node in selected_nodes)
 
     # Add the renderableOnly flag if curves should NOT be included.
     # This is the key change for the new functionality.
-    if not include_curves:
-        job_args.append("-renderableOnly")
+    curves_flag = "" if include_curves else " -renderableOnly"
 
     # Add the stripNamespaces flag if enabled
-    if strip_namespaces:
-        job_args.append("-stripNamespaces 0")
+    namespace_flag = " -stripNamespaces 0" if strip_namespaces else ""
 
-    # Finally, add the file path argument, ensuring it's correctly escaped
-    job_args.append(f'-file \\"{path}\\"')
-    
-    job_arg_string = " ".join(job_args)
-    mel_command = f'AbcExport -j "{job_arg_string}";'
+    # Single template; the file path argument goes last, correctly escaped
+    mel_command = (
+        f'AbcExport -j "-frameRange {start_frame} {end_frame} -uvWrite -writeColorSets '
+        f'-writeUVSets -dataFormat ogawa {roots_arg}{curves_flag}{namespace_flag} '
+        f'-file \\"{escaped_path}\\"";'
+    )
     
     # --- Execute MEL Command ---
     print(f"Executing MEL command: {mel_command}")
@@ -122,15 +128,13 @@ def execute_with_dialog():
 
 def get_command():
     """Returns the command implementation for standalone execution."""
-    def _command():
-        importlib.reload(sys.modules[__name__])
-        execute_with_dialog()
-    return _command
+    return execute_with_dialog
 
 def execute():
     """
     Main entry point for running this script standalone to export an animation.
+    Set MAYADY_DEV_RELOAD to re-read this module on every call while developing.
     """
-    importlib.reload(sys.modules[__name__])
-    cmd = get_command()
-    cmd()
\ No newline at end of file
+    if os.environ.get("MAYADY_DEV_RELOAD"):
+        importlib.reload(sys.modules[__name__])
+    execute_with_dialog()
\ No newline at end of file